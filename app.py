@@ -1,19 +1,71 @@
 
-from flask import Flask, render_template, request, redirect, url_for, flash, session, send_file, jsonify, Response, stream_with_context
+from flask import Flask, render_template, request, redirect, url_for, flash, session, send_file, jsonify, Response, stream_with_context, stream_template, g
 import pandas as pd
+import numpy as np
 from datetime import datetime
 import os
 import json
-from werkzeug.utils import secure_filename
 import io
+from collections import OrderedDict
+from functools import lru_cache, wraps
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from PIL import Image, ImageDraw, ImageFont
 import threading
 import queue
+import time
 import sqlite3
+import zlib
+import csv
+import shutil
+import socket
+from flask.json.provider import DefaultJSONProvider
 from config_manager import ConfigManager, PasswordManager, EnvironmentManager, AuditLogger
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+if orjson is not None:
+    def _dumps(obj):
+        """Serialize obj to a compact JSON string."""
+        return orjson.dumps(obj).decode()
+    _loads = orjson.loads
+else:
+    def _dumps(obj):
+        """Serialize obj to a compact JSON string."""
+        return json.dumps(obj, separators=(",", ":"))
+    _loads = json.loads
+
+def _sse_frame(obj):
+    """Encode obj as a complete SSE data frame, ready to write to any client."""
+    body = orjson.dumps(obj) if orjson is not None else _dumps(obj).encode('utf-8')
+    return b"data: " + body + b"\n\n"
+
 app = Flask(__name__)
 
+if orjson is not None:
+    class OrjsonProvider(DefaultJSONProvider):
+        """jsonify / request.get_json through orjson; types it rejects fall back to Flask's encoder.
+
+        Output matches DefaultJSONProvider: keys sorted when sort_keys is set,
+        dates rendered as HTTP dates through Flask's own default hook.
+        """
+
+        OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+        def dumps(self, obj, **kwargs):
+            option = self.OPTIONS | orjson.OPT_SORT_KEYS if self.sort_keys else self.OPTIONS
+            try:
+                return orjson.dumps(obj, default=self.default, option=option).decode()
+            except TypeError:
+                return super().dumps(obj, **kwargs)
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
 # Initialize configuration managers
 config_manager = ConfigManager()
 password_manager = PasswordManager()
@@ -50,13 +102,28 @@ def parse_currency_input(value):
     else:
         return int(float(value))  # Direct number
 
+class _Cfg:
+    """Read-only snapshot of the active configuration.
+
+    Snapshots are never mutated; a config change builds a new one and
+    swaps the module-level CURRENT reference in a single assignment, so
+    readers that grab `cfg = CURRENT` always see a consistent set of values.
+    """
+    __slots__ = ("CONFIG", "TEAMS", "TEAMS_SET", "TEAM_BUDGET", "BASE_PRICE")
+
+    def __init__(self, config):
+        self.CONFIG = config
+        self.TEAMS = config["teams"]["names"]
+        self.TEAMS_SET = frozenset(self.TEAMS)  # O(1) membership checks
+        self.TEAM_BUDGET = config["teams"]["budget"]
+        self.BASE_PRICE = config["auction"]["base_price"]
+
 # Load config at startup
-CONFIG = load_config()
+CURRENT = _Cfg(load_config())
+config_version = 0
 
-# Dynamic configuration from config file
-TEAM_BUDGET = CONFIG["teams"]["budget"]
-BASE_PRICE = CONFIG["auction"]["base_price"]
-TEAMS = CONFIG["teams"]["names"]
+# Serializes config writers; readers never take it
+_config_lock = threading.Lock()
 
 # Minimum role requirements per team
 MIN_BATTERS = 2
@@ -70,44 +137,48 @@ current_auction = {
     "current_team": "",
     "status": "waiting",  # waiting, bidding, going, sold
     "announcement": None,
+    "history": [],  # every bid on the current player, for undo
 }
 
+# Serializes check-then-update sequences on current_auction across request threads
+_auction_lock = threading.RLock()
+
+def with_auction_lock(view):
+    """Run a view holding _auction_lock, so its validation and update are atomic."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        with _auction_lock:
+            return view(*args, **kwargs)
+    return wrapper
+
 # Version counter for public live view; increments on state changes
 auction_version = 0
 
-# Cache for build_live_payload to avoid repeated DB calls
-_payload_cache = {"df": None, "last_update": 0}
-
-def build_live_payload():
-    """Build a minimal JSON-serializable payload representing live state."""
-    import time
-    # Use cached data if less than 1 second old
-    now = time.time()
-    if _payload_cache["df"] is None or (now - _payload_cache["last_update"]) > 1:
-        print(f"DEBUG: Loading fresh player data for payload")
-        _payload_cache["df"] = load_players()
-        _payload_cache["last_update"] = now
-    else:
-        print(f"DEBUG: Using cached player data for payload")
-    df = _payload_cache["df"]
+def build_live_payload(ts=None):
+    """Build a minimal JSON-serializable payload representing live state.
+
+    `ts` is the payload time in epoch milliseconds; taken now when omitted.
+    """
+    # Copy under the lock so a concurrent bid cannot be seen half-applied
+    with _auction_lock:
+        auction = dict(current_auction)
     payload = {
-        "ts": datetime.now().isoformat(),
+        "ts": int(time.time() * 1000) if ts is None else ts,
         "auction": {
-            "status": current_auction.get("status"),
-            "current_bid": current_auction.get("current_bid", 0),
-            "current_team": current_auction.get("current_team") or "",
+            "status": auction.get("status"),
+            "current_bid": auction.get("current_bid", 0),
+            "current_team": auction.get("current_team") or "",
         },
         "starting_team": compute_starting_team(),
         "player": None,
         "eligible": [],
         "next_bid": None,
-        "announcement": current_auction.get("announcement"),
-        "player_sold": current_auction.get("player_sold", False),
+        "announcement": auction.get("announcement"),
+        "player_sold": auction.get("player_sold", False),
     }
-    if current_auction.get("player_id"):
-        row = df[df["player_id"] == current_auction["player_id"]]
-        if not row.empty:
-            p = row.iloc[0].to_dict()
+    if auction.get("player_id"):
+        p = get_player(auction["player_id"])
+        if p is not None:
             payload["player"] = {
                 "id": int(p.get("player_id")),
                 "name": p.get("name") or "",
@@ -116,159 +187,279 @@ def build_live_payload():
                 "photo": p.get("photo") or "default.png",
             }
             # If already sold, don't show eligible bidders
-            if (current_auction.get("status") or "").lower() != "sold":
-                limits = compute_team_limits(df, p, current_auction.get("current_bid", 0), current_team=current_auction.get("current_team", ""))
-                # Only eligible teams; convert to list of dicts
-                eligible = []
-                for team, info in limits.items():
-                    if info.get("can_bid_now"):
-                        eligible.append({
-                            "team": team,
-                            "max_valid_bid": int(info.get("max_valid_bid") or 0),
-                            "remaining": int(info.get("remaining") or 0),
-                            "players_with_captain": int(info.get("players_with_captain") or 0),
-                            "near_limit": bool(info.get("near_limit")),
-                        })
-                # Sort eligible by highest max_valid_bid desc
-                eligible.sort(key=lambda x: x["max_valid_bid"], reverse=True)
-                payload["eligible"] = eligible
-                # Calculate next required bid
-                payload["next_bid"] = get_next_required_bid(
-                    current_auction.get("current_bid", 0),
-                    p.get("base_price", 0),
-                    bool(current_auction.get("current_team")),
-                )
+            if (auction.get("status") or "").lower() != "sold":
+                payload["eligible"], payload["next_bid"] = compute_live_state(p, get_team_aggregates(), auction)
     return payload
 
+def compute_live_state(player, totals, auction_state):
+    """Eligible bidders and next required bid for `player` from team aggregates.
+
+    Returns (eligible, next_bid); eligible is sorted by max_valid_bid, highest first.
+    """
+    current_bid = auction_state.get("current_bid", 0)
+    current_team = auction_state.get("current_team", "")
+    limits = compute_team_limits(totals, player, current_bid, current_team=current_team)
+    # Only eligible teams; convert to list of dicts
+    eligible = []
+    for team, info in limits.items():
+        if info.get("can_bid_now"):
+            eligible.append({
+                "team": team,
+                "max_valid_bid": int(info.get("max_valid_bid") or 0),
+                "remaining": int(info.get("remaining") or 0),
+                "players_with_captain": int(info.get("players_with_captain") or 0),
+                "near_limit": bool(info.get("near_limit")),
+            })
+    eligible.sort(key=lambda x: x["max_valid_bid"], reverse=True)
+    next_bid = get_next_required_bid(current_bid, player.get("base_price", 0), bool(current_team))
+    return eligible, next_bid
+
+# More than SSE_BURST_LIMIT frames, each within SSE_BURST_WINDOW seconds of the
+# last, makes a stream sleep SSE_BURST_PAUSE so further updates coalesce
+SSE_BURST_WINDOW = 0.1
+SSE_BURST_LIMIT = 5
+SSE_BURST_PAUSE = 0.05
+
+# Recent payloads by version so broadcasts can ship only what changed
+PAYLOAD_HISTORY_SIZE = 4
+_last_payload_by_version = OrderedDict()
+# Keeps version bumps and their diffs in order across request threads
+_broadcast_lock = threading.Lock()
+
+def diff_payload(old, new):
+    """Return the top-level payload keys that differ between two states."""
+    return {
+        "changed": {k: v for k, v in new.items() if k not in old or old[k] != v},
+        "removed": [k for k in old if k not in new],
+    }
+
+def _same_state(old, new):
+    """True when two payloads differ at most in their timestamp."""
+    return old.keys() == new.keys() and all(old[k] == v for k, v in new.items() if k != "ts")
+
 def broadcast_state():
-    """Increment version and push a JSON state payload to SSE listeners."""
-    global auction_version, _sse_clients, _sse_lock
-    auction_version += 1
-    message = json.dumps({
-        "type": "state",
-        "version": auction_version,
-        "payload": build_live_payload(),
-    })
-    with _sse_lock:
-        dead_clients = set()
-        for q in list(_sse_clients):
-            try:
-                q.put_nowait(message)
-            except Exception:
-                dead_clients.add(q)
-        # Remove dead clients
-        _sse_clients -= dead_clients
+    """Increment version and push the state change to SSE listeners.
+
+    Clients get a patch against the previous version when it is known and
+    the full state otherwise; a payload equal to the last one is not sent. Each client only keeps the latest message, so
+    a slow client that skipped versions is sent the full state instead.
+    """
+    global auction_version
+    ts = int(time.time() * 1000)
+    with _broadcast_lock:
+        payload = build_live_payload(ts=ts)
+        prev_version = auction_version
+        prev_payload = _last_payload_by_version.get(prev_version)
+        if prev_payload is not None and _same_state(prev_payload, payload):
+            return  # nothing a viewer could see has changed
+        auction_version += 1
+        _last_payload_by_version[auction_version] = payload
+        while len(_last_payload_by_version) > PAYLOAD_HISTORY_SIZE:
+            _last_payload_by_version.popitem(last=False)
+        version = auction_version
+        if prev_payload is None:
+            base_version = None
+            message = _sse_frame({
+                "type": "state",
+                "version": version,
+                "payload": payload,
+            })
+        else:
+            base_version = prev_version
+            message = _sse_frame({
+                "type": "patch",
+                "from": prev_version,
+                "to": version,
+                "payload": diff_payload(prev_payload, payload),
+            })
+    _fan_out(base_version, version, message)
+
+# Mutations within BROADCAST_DEBOUNCE seconds of each other go out as one broadcast
+BROADCAST_DEBOUNCE = 0.015
+_broadcast_timer = None
+_broadcast_timer_lock = threading.Lock()
+
+def schedule_broadcast():
+    """Broadcast the state shortly, merging with any broadcast already pending."""
+    global _broadcast_timer
+    with _broadcast_timer_lock:
+        if _broadcast_timer is None:
+            _broadcast_timer = threading.Timer(BROADCAST_DEBOUNCE, _flush_broadcast)
+            _broadcast_timer.daemon = True
+            _broadcast_timer.start()
+
+def _flush_broadcast():
+    global _broadcast_timer
+    # Disarm first so a mutation made while building schedules a fresh broadcast
+    with _broadcast_timer_lock:
+        _broadcast_timer = None
+    broadcast_state()
+
+_state_msg_cache = (None, None, None)
+
+def state_message():
+    """Return (version, SSE frame) of a full-state message for the current state.
+
+    Serialized once per auction/players/config version and shared by every
+    connecting or resyncing SSE client.
+    """
+    global _state_msg_cache
+    key = (auction_version, _players_version, config_version)
+    cached_key, version, message = _state_msg_cache
+    if cached_key == key:
+        return version, message
+    version = key[0]
+    message = _sse_frame({"type": "state", "version": version, "payload": build_live_payload()})
+    _state_msg_cache = (key, version, message)
+    return version, message
 
 def broadcast_live_only():
     """Increment version but don't build full payload - for next player updates."""
-    global auction_version, _sse_clients, _sse_lock
+    global auction_version
     auction_version += 1
     # Send minimal update for live view only
-    message = json.dumps({
+    message = _sse_frame({
         "type": "player_change",
         "version": auction_version,
         "player_id": int(current_auction.get("player_id") or 0),
     })
-    with _sse_lock:
-        dead_clients = set()
-        for q in list(_sse_clients):
-            try:
-                q.put_nowait(message)
-            except Exception:
-                dead_clients.add(q)
-        # Remove dead clients
-        _sse_clients -= dead_clients
+    _fan_out(None, auction_version, message)
+
+class _SSEClient:
+    """Latest-message mailbox for one SSE connection.
 
-# SSE subscription state
+    Broadcasts overwrite the pending message instead of queueing behind it,
+    so a slow client costs one message of memory and never gets dropped.
+    """
+    __slots__ = ("cond", "base_version", "version", "message")
+
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.base_version = None  # version a patch applies to; None for full messages
+        self.version = 0
+        self.message = None
+
+    def publish(self, base_version, version, message):
+        with self.cond:
+            # Broadcasts can finish out of order; never go backwards
+            if version > self.version:
+                self.base_version = base_version
+                self.version = version
+                self.message = message
+                self.cond.notify()
+
+    def wait(self, after_version, timeout):
+        """Block until a message newer than after_version arrives or timeout.
+
+        Returns (base_version, version, message), or None on timeout.
+        """
+        with self.cond:
+            if not self.cond.wait_for(lambda: self.version > after_version, timeout):
+                return None
+            return self.base_version, self.version, self.message
+
+# SSE subscription state. The client tuple is copy-on-write: writers swap
+# in a new tuple under the lock, so broadcasters can iterate a snapshot
+# without holding it.
 _sse_lock = threading.Lock()
-_sse_clients = set()
+_sse_clients = ()
 
 def _subscribe_sse():
-    q = queue.Queue(maxsize=100)
+    global _sse_clients
+    client = _SSEClient()
     with _sse_lock:
-        _sse_clients.add(q)
-    return q
+        _sse_clients = _sse_clients + (client,)
+    return client
 
-def _unsubscribe_sse(q):
+def _unsubscribe_sse(client):
+    global _sse_clients
     with _sse_lock:
-        _sse_clients.discard(q)
+        _sse_clients = tuple(c for c in _sse_clients if c is not client)
+
+def _fan_out(base_version, version, message):
+    """Hand message to every SSE client, replacing whatever it had not sent yet."""
+    for client in _sse_clients:
+        client.publish(base_version, version, message)
+
+def publish_config(config):
+    """Make `config` the active configuration and resync live viewers."""
+    global CURRENT, config_version
+    snapshot = _Cfg(config)
+    with _config_lock:
+        CURRENT = snapshot
+        config_version += 1
+        app.jinja_env.globals.update(CONFIG=config, all_price_options=get_auction_price_options(snapshot.BASE_PRICE))
+    # Schedules and steps for the old increments will not be asked for again
+    _price_schedule.cache_clear()
+    _next_bid_after.cache_clear()
+    schedule_broadcast()
 
 # Sequential auction state
 sequential_auction = {
     "active": False,
     "current_index": 0,
-    "player_sequence": []  # Will be populated with unsold player IDs
+    "player_sequence": np.empty(0, dtype=np.int32)  # Will be populated with unsold player IDs
 }
 
 def format_indian_currency(amount):
     """Format currency in Indian format (50L, 1Cr, etc.)"""
     if amount == 0:
         return "0"
-    
-    amount = int(amount)
-    if amount >= 10000000:  # 1 Crore or more
-        crores = amount / 10000000
-        # Show up to 2 decimals (e.g., 1.25Cr, 1.75Cr) and trim trailing zeros
-        crores_rounded = round(crores + 1e-9, 2)  # tiny epsilon to avoid 1.249999
-        s = f"{crores_rounded:.2f}".rstrip('0').rstrip('.')
-        return f"{s}Cr"
-    elif amount >= 100000:  # 1 Lakh or more
-        lakhs = amount / 100000
-        if lakhs == int(lakhs):
-            return f"{int(lakhs)}L"
-        else:
-            return f"{lakhs:.1f}L"
+    return _format_inr(int(amount))
+
+@lru_cache(maxsize=4096)
+def _format_inr(amount):
+    # Integer arithmetic throughout; halves round up
+    if amount >= 10000000:  # 1 Crore or more, up to 2 decimals
+        crores, hundredths = divmod((amount + 50000) // 100000, 100)
+        if hundredths == 0:
+            return f"{crores}Cr"
+        if hundredths % 10 == 0:
+            return f"{crores}.{hundredths // 10}Cr"
+        return f"{crores}.{hundredths:02d}Cr"
+    elif amount >= 100000:  # 1 Lakh or more, up to 1 decimal
+        if amount % 100000 == 0:
+            return f"{amount // 100000}L"
+        lakhs, tenths = divmod((amount + 5000) // 10000, 10)
+        return f"{lakhs}.{tenths}L"
     else:
         return f"₹{amount:,}"
 
+@lru_cache(maxsize=1024)
+def _price_schedule(start, base_price, increments, count):
+    """First `count` bid levels from `start`, stepping by the tier of each level.
+
+    Tier 1 (below 2x base) steps by increments[0], tier 2 (below 4x base) by
+    increments[1], tier 3 by increments[2]. Each tier is laid out as one
+    range instead of branching per level.
+    """
+    if min(increments) <= 0:
+        return (start,) * count
+    levels = []
+    current = start
+    for hi, step in ((base_price * 2, increments[0]), (base_price * 4, increments[1])):
+        if current < hi:
+            tier = range(current, hi, step)
+            levels.extend(tier[:count - len(levels)])
+            current = tier[-1] + step
+        if len(levels) >= count:
+            return tuple(levels)
+    levels.extend(range(current, current + (count - len(levels)) * increments[2], increments[2]))
+    return tuple(levels)
+
 def get_bid_increments(current_bid):
     """Generate valid bid increment options based on current bid relative to base price"""
-    config = load_config()
-    base_price = config["auction"]["base_price"]
-    increments_config = config["auction"]["increments"]
-    
-    increments = []
-    current = current_bid
-    
-    # Generate 10 increment options
-    for i in range(10):
-        increments.append(current)
-        
-        # Determine increment based on current price relative to base price
-        if current < base_price * 2:  # Tier 1: Base to 2x Base
-            current += increments_config[0]
-        elif current < base_price * 4:  # Tier 2: 2x to 4x Base
-            current += increments_config[1]
-        else:  # Tier 3: 4x Base+
-            current += increments_config[2]
-    
-    return increments
+    auction_config = CURRENT.CONFIG["auction"]
+    return list(_price_schedule(int(current_bid), auction_config["base_price"], tuple(auction_config["increments"]), 10))
 
 def get_auction_price_options(base_price):
     """Generate comprehensive price options for auction page"""
-    config = load_config()
-    increments_config = config["auction"]["increments"]
-    
-    options = []
-    current = base_price
-    
-    # Generate 60 options to reach higher amounts
-    for i in range(60):
-        options.append(current)
-        
-        # Determine increment based on current price relative to base price
-        if current < base_price * 2:  # Tier 1: Base to 2x Base
-            current += increments_config[0]
-        elif current < base_price * 4:  # Tier 2: 2x to 4x Base
-            current += increments_config[1]
-        else:  # Tier 3: 4x Base+
-            current += increments_config[2]
-    
-    return options
+    increments = tuple(CURRENT.CONFIG["auction"]["increments"])
+    return list(_price_schedule(int(base_price), int(base_price), increments, 60))
 
 def get_increment_slabs_display():
     """Generate human-readable increment slabs text from config"""
-    config = load_config()
+    config = CURRENT.CONFIG
     base_price = config["auction"]["base_price"]
     increments = config["auction"]["increments"]
     
@@ -284,76 +475,150 @@ def get_increment_slabs_display():
     return f"{tier1_range}: {tier1_inc} | {tier2_range}: {tier2_inc} | {tier3_range}: {tier3_inc}"
 
 # Make functions available in templates
-import time
-app.jinja_env.globals.update(int=int, format_currency=format_indian_currency, get_bid_increments=get_bid_increments, get_auction_price_options=get_auction_price_options, get_increment_slabs_display=get_increment_slabs_display, timestamp=lambda: int(time.time()), CONFIG=CONFIG)
+def _request_timestamp():
+    """Cache-busting timestamp, read once per request in _stamp_request."""
+    return g.get("request_ts") or int(time.time())
+
+app.jinja_env.globals.update(int=int, format_currency=format_indian_currency, get_bid_increments=get_bid_increments, get_auction_price_options=get_auction_price_options, get_increment_slabs_display=get_increment_slabs_display, timestamp=_request_timestamp, CONFIG=CURRENT.CONFIG)
+# Price ladder for the default base price; the admin table reuses it for most rows
+app.jinja_env.globals.update(all_price_options=get_auction_price_options(CURRENT.BASE_PRICE))
+
+@app.before_request
+def _stamp_request():
+    g.request_ts = int(time.time())
+
+# Endpoints that redirect to the login page unless the session is admin
+ADMIN_ENDPOINTS = set()
+
+def admin_only(view):
+    """Mark a view as admin-only; the check runs once in _require_admin."""
+    ADMIN_ENDPOINTS.add(view.__name__)
+    return view
+
+@app.before_request
+def _check_external_writes():
+    if request.endpoint != "static":
+        _sync_external_writes()
+
+@app.before_request
+def _require_admin():
+    if request.endpoint in ADMIN_ENDPOINTS and not session.get("is_admin"):
+        return redirect(url_for("admin"))
 
 # Add filter for replacing empty values with dash
 @app.template_filter('dash_if_empty')
 def dash_if_empty(value):
     return value if value and str(value).strip() and str(value) != 'nan' else '-'
 
+def _to_int(value):
+    """Coerce a stored numeric field ('' / None / float / str) to int, 0 if blank."""
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return 0
+
+def split_sold_unsold(rows):
+    """Split rows into (still available, sold) lists, skipping captains."""
+    unsold, sold = [], []
+    for r in rows:
+        status = r["status"]
+        if status == "sold":
+            sold.append(r)
+        elif status != "captain":
+            unsold.append(r)
+    return unsold, sold
+
+def highest_valid_bid(start, max_bid, tier1_hi, tier2_hi, inc, flat=False):
+    """Highest bid reachable from `start` by valid increments without exceeding max_bid.
+
+    Bids step by inc[0] below tier1_hi, inc[1] below tier2_hi and inc[2]
+    above; with `flat` (last-slot rule) every step is inc[0]. Returns 0 when
+    even `start` is out of reach.
+    """
+    if start is None or max_bid < start:
+        return 0
+    cand = start
+    tiers = () if flat else ((tier1_hi, inc[0]), (tier2_hi, inc[1]))
+    for hi, step in tiers:
+        if cand >= hi:
+            continue
+        if step <= 0:
+            return cand
+        # First bid at or past the tier boundary
+        exit_val = cand + -(-(hi - cand) // step) * step
+        if exit_val > max_bid:
+            return cand + ((max_bid - cand) // step) * step
+        cand = exit_val
+    step = inc[0] if flat else inc[2]
+    if step <= 0:
+        return cand
+    return cand + ((max_bid - cand) // step) * step
+
 # Helper to compute per-team max bid capacity for a given player and current bid
-def compute_team_limits(df, player, current_bid, current_team=""):
-    team_budget = CONFIG["teams"]["budget"]
-    base_price_rule = CONFIG["auction"]["base_price"]
-    max_players_allowed = CONFIG["teams"].get("max_players", 9)
+def team_bid_caps(totals):
+    """Player-independent bidding figures per team from team aggregates.
+
+    Returns {team: (remaining, max_bid, sold, captain)}. max_bid holds back
+    the base price for every slot still to fill after the next purchase.
+    """
+    cfg = CURRENT
+    team_budget = cfg.CONFIG["teams"]["budget"]
+    base_price_rule = cfg.CONFIG["auction"]["base_price"]
+    max_players_allowed = cfg.CONFIG["teams"].get("max_players", 9)
+    empty = {"spent": 0, "sold": 0, "captain": 0}
+    caps = {}
+    for team in cfg.TEAMS:
+        t = totals.get(team, empty)
+        sold_count = t["sold"]
+        captain_count = t["captain"]
+        remaining = int(team_budget - int(t["spent"]))
+
+        # If already at or above max players (including captain), cannot bid
+        if sold_count + captain_count >= max_players_allowed:
+            max_bid = 0
+        else:
+            # Reserve budget for remaining slots AFTER buying this player (exclude captain and this player)
+            reserve_slots = max(0, max_players_allowed - captain_count - sold_count - 1)
+            max_bid = int(max(0, remaining - (reserve_slots * base_price_rule)))
+        caps[team] = (remaining, max_bid, sold_count, captain_count)
+    return caps
+
+def compute_team_limits(totals, player, current_bid, current_team=""):
+    cfg = CURRENT
+    base_price_rule = cfg.CONFIG["auction"]["base_price"]
 
     # Determine next required bids relative to current auction state
     effective_current = current_bid or 0
     no_leading_bid = (not current_team)
-    # Precompute aggregates for all teams
-    df_status = df.get("status", pd.Series(dtype=str)).astype(str).str.lower()
-    df_team = df.get("team", pd.Series(dtype=str))
-    sold_prices = pd.to_numeric(df.get("sold_price", pd.Series(dtype=float)), errors="coerce").fillna(0)
-    spent_by_team = sold_prices.groupby(df_team).sum()
-    sold_count_by_team = (df_status == "sold").groupby(df_team).sum()
-    captain_count_by_team = (df_status == "captain").groupby(df_team).sum()
+    team_state = get_team_state()
     # Last-slot rule: if any team would reach max with this purchase
-    last_slot_exists = False
-    for team in TEAMS:
-        sold_count = int(sold_count_by_team.get(team, 0))
-        captain_count = int(captain_count_by_team.get(team, 0))
-        if sold_count + captain_count == max_players_allowed - 1:
-            last_slot_exists = True
-            break
+    last_slot_exists = team_state["last_slot"]
+    # Per-team caps only change with the players or config; reuse the cached
+    # ones when called with the current aggregates
+    caps = team_state["caps"] if totals is get_team_aggregates() else team_bid_caps(totals)
 
     if effective_current <= player["base_price"] and no_leading_bid:
         # First bid can be at base price
         min_next_bid = player["base_price"]
         # For second next bid, depend on rule
-        step = CONFIG["auction"]["increments"][0] if last_slot_exists else (
-            CONFIG["auction"]["increments"][0] if player["base_price"] < base_price_rule * 2 else (
-                CONFIG["auction"]["increments"][1] if player["base_price"] < base_price_rule * 4 else CONFIG["auction"]["increments"][2]
+        step = cfg.CONFIG["auction"]["increments"][0] if last_slot_exists else (
+            cfg.CONFIG["auction"]["increments"][0] if player["base_price"] < base_price_rule * 2 else (
+                cfg.CONFIG["auction"]["increments"][1] if player["base_price"] < base_price_rule * 4 else cfg.CONFIG["auction"]["increments"][2]
             )
         )
         second_next_bid = min_next_bid + step if min_next_bid is not None else None
     else:
         # Next price based on increments; allow smallest slab if last-slot rule applies
         if last_slot_exists:
-            min_next_bid = effective_current + CONFIG["auction"]["increments"][0]
-            second_next_bid = min_next_bid + CONFIG["auction"]["increments"][0]
+            min_next_bid = effective_current + cfg.CONFIG["auction"]["increments"][0]
+            second_next_bid = min_next_bid + cfg.CONFIG["auction"]["increments"][0]
         else:
             next_prices = [p for p in get_bid_increments(effective_current) if p > effective_current]
             min_next_bid = next_prices[0] if next_prices else None
             second_next_bid = next_prices[1] if len(next_prices) > 1 else None
 
     team_limits = {}
-    for team in TEAMS:
-        spent = int(spent_by_team.get(team, 0))
-        sold_count = int(sold_count_by_team.get(team, 0))
-        captain_count = int(captain_count_by_team.get(team, 0))
-
-        remaining = int(team_budget - int(spent))
-
-        # If already at or above max players (including captain), cannot bid
-        if sold_count + captain_count >= max_players_allowed:
-            max_bid = 0
-        else:
-            # Reserve budget for remaining slots AFTER buying this player (exclude captain and this player)
-            reserve_slots = max(0, max_players_allowed - captain_count - sold_count - 1)
-            max_bid = remaining - (reserve_slots * base_price_rule)
-            max_bid = int(max(0, max_bid))
-
+    for team, (remaining, max_bid, sold_count, captain_count) in caps.items():
         if min_next_bid is None:
             can_bid_now = False
         else:
@@ -361,33 +626,15 @@ def compute_team_limits(df, player, current_bid, current_team=""):
 
         near_limit = can_bid_now and (second_next_bid is not None) and (max_bid < second_next_bid)
 
-        # Compute highest valid bid reachable within increments (not exceeding max_bid)
-        def next_step(val):
-            if last_slot_exists:
-                return val + CONFIG["auction"]["increments"][0]
-            if val < base_price_rule * 2:
-                return val + CONFIG["auction"]["increments"][0]
-            elif val < base_price_rule * 4:
-                return val + CONFIG["auction"]["increments"][1]
-            else:
-                return val + CONFIG["auction"]["increments"][2]
-
-        # Starting point: first required bid (min_next_bid). If no leading team and current at base, this is base.
-        highest_valid = 0
-        start = min_next_bid
-        # If still none, nothing is reachable
-        if start is not None and max_bid >= start:
-            cand = start
-            # Iterate up to a safe bound
-            for _ in range(200):
-                if cand <= max_bid:
-                    highest_valid = cand
-                else:
-                    break
-                new_val = next_step(cand)
-                if new_val == cand:
-                    break
-                cand = new_val
+        # Highest bid reachable from the first required bid without exceeding max_bid
+        highest_valid = highest_valid_bid(
+            min_next_bid,
+            max_bid,
+            base_price_rule * 2,
+            base_price_rule * 4,
+            cfg.CONFIG["auction"]["increments"],
+            flat=last_slot_exists,
+        )
 
         team_limits[team] = {
             "remaining": remaining,
@@ -413,25 +660,15 @@ def get_next_required_bid(current_bid, base_price, has_leader):
         return None
     if not has_leader:
         return current_bid if current_bid >= base_price else base_price
+    return _next_bid_after(current_bid, get_team_state()["last_slot"])
+
+@lru_cache(maxsize=2048)
+def _next_bid_after(current_bid, last_slot):
+    """Next price above current_bid under the active config; cleared by publish_config."""
+    cfg = CURRENT
     # Last-slot rule: if any team is at max-1 players, use smallest increment
-    try:
-        df = load_players()
-        df_status = df.get("status", pd.Series(dtype=str)).astype(str).str.lower()
-        df_team = df.get("team", pd.Series(dtype=str))
-        sold_count_by_team = (df_status == "sold").groupby(df_team).sum()
-        captain_count_by_team = (df_status == "captain").groupby(df_team).sum()
-        max_players_allowed = CONFIG["teams"].get("max_players", 9)
-        last_slot_exists = False
-        for team in TEAMS:
-            sold_c = int(sold_count_by_team.get(team, 0))
-            cap_c = int(captain_count_by_team.get(team, 0))
-            if sold_c + cap_c == max_players_allowed - 1:
-                last_slot_exists = True
-                break
-        if last_slot_exists:
-            return current_bid + CONFIG["auction"]["increments"][0]
-    except Exception:
-        pass
+    if last_slot:
+        return current_bid + cfg.CONFIG["auction"]["increments"][0]
     for p in get_bid_increments(current_bid):
         if p > current_bid:
             return p
@@ -439,10 +676,11 @@ def get_next_required_bid(current_bid, base_price, has_leader):
 
 # Helper: compute starting team for current player in sequential auction
 def compute_starting_team():
+    cfg = CURRENT
     try:
-        if sequential_auction.get("active") and TEAMS:
+        if sequential_auction.get("active") and cfg.TEAMS:
             idx = sequential_auction.get("current_index", 0)
-            return TEAMS[idx % len(TEAMS)]
+            return cfg.TEAMS[idx % len(cfg.TEAMS)]
     except Exception:
         pass
     return None
@@ -450,10 +688,31 @@ def compute_starting_team():
 # Database file path - can be overridden with DATABASE_PATH environment variable
 DB_FILE = os.getenv('DATABASE_PATH', os.path.join(os.path.dirname(__file__), "players.db"))
 
+# One process-wide connection instead of a connect/close per call. WAL lets
+# the export endpoint and external tools read while the app writes. The
+# connection is shared by all request threads, which gives no isolation
+# between them, so every use goes through _db_lock.
+_DB = sqlite3.connect(DB_FILE, check_same_thread=False, isolation_level=None)
+_DB.executescript("PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA temp_store=MEMORY; PRAGMA cache_size=-20000; PRAGMA busy_timeout=5000;")
+_db_lock = threading.RLock()
+
+PLAYER_STATUSES = frozenset({"unsold", "sold", "captain"})
+
+def normalize_status(value):
+    """Lowercase a status for storage; blank or unknown values become 'unsold'."""
+    status = str(value or "").strip().lower()
+    return status if status in PLAYER_STATUSES else "unsold"
+
+PLAYER_FIELDS = (
+    "player_id", "name", "age", "role", "batting_style", "bowling_style",
+    "base_price", "team", "status", "sold_price", "sold_at", "photo",
+)
+PLAYER_COLUMNS = frozenset(PLAYER_FIELDS)
+
 def init_db():
     """Initialize SQLite database with players table"""
-    conn = sqlite3.connect(DB_FILE)
-    conn.execute('''
+    with _db_lock:
+        _DB.execute('''
         CREATE TABLE IF NOT EXISTS players (
             player_id INTEGER PRIMARY KEY,
             name TEXT NOT NULL,
@@ -463,23 +722,42 @@ def init_db():
             bowling_style TEXT,
             base_price INTEGER,
             team TEXT,
-            status TEXT DEFAULT 'unsold',
+            status TEXT DEFAULT 'unsold' CHECK(status IN ('unsold', 'sold', 'captain')),
             sold_price INTEGER DEFAULT 0,
             sold_at TEXT,
             photo TEXT
         )
     ''')
-    conn.commit()
-    conn.close()
+        # Tables written by older versions (or by to_sql) may hold mixed-case status
+        _DB.execute('''
+            UPDATE players
+            SET status = CASE WHEN LOWER(TRIM(status)) IN ('sold', 'captain') THEN LOWER(TRIM(status)) ELSE 'unsold' END
+            WHERE status IS NULL OR status NOT IN ('unsold', 'sold', 'captain')
+        ''')
+        _ensure_schema()
+
+def _ensure_schema():
+    """Create the players indexes and status guards; to_sql(if_exists='replace') drops them.
+
+    (team, status, sold_price) covers the per-team aggregate query and
+    player_id backs point lookups and updates. The triggers stand in for the
+    status CHECK on tables pandas created without it. Caller holds _db_lock.
+    """
+    _DB.executescript('''
+        CREATE INDEX IF NOT EXISTS idx_players_team_status ON players(team, status, sold_price);
+        CREATE INDEX IF NOT EXISTS idx_players_player_id ON players(player_id);
+        CREATE TRIGGER IF NOT EXISTS players_status_insert BEFORE INSERT ON players
+        WHEN NEW.status NOT IN ('unsold', 'sold', 'captain')
+        BEGIN SELECT RAISE(ABORT, 'invalid player status'); END;
+        CREATE TRIGGER IF NOT EXISTS players_status_update BEFORE UPDATE OF status ON players
+        WHEN NEW.status NOT IN ('unsold', 'sold', 'captain')
+        BEGIN SELECT RAISE(ABORT, 'invalid player status'); END;
+    ''')
 
 # Initialize database on startup
 init_db()
 
-# Debug database info
-print(f"DEBUG: Using database file: {DB_FILE}")
-print(f"DEBUG: Database file exists: {os.path.exists(DB_FILE)}")
-if os.path.exists(DB_FILE):
-    print(f"DEBUG: Database file size: {os.path.getsize(DB_FILE)} bytes")
+app.logger.debug("Using database file: %s", DB_FILE)
 
 # Migrate CSV data to SQLite if CSV exists
 def migrate_csv_to_db():
@@ -488,14 +766,17 @@ def migrate_csv_to_db():
         try:
             df = pd.read_csv(csv_file)
             if not df.empty:
-                conn = sqlite3.connect(DB_FILE)
+                # Store status normalized, as every other write path does
+                df["status"] = df["status"].map(normalize_status) if "status" in df.columns else "unsold"
                 # Always migrate from CSV to ensure we're using SQLite
-                df.to_sql('players', conn, if_exists='replace', index=False)
+                with _db_lock:
+                    df.to_sql('players', _DB, if_exists='replace', index=False)
+                    # The replaced table lost its indexes and status triggers
+                    _ensure_schema()
                 print(f"Migrated {len(df)} players from CSV to SQLite")
                 # Remove CSV file after successful migration
                 os.remove(csv_file)
                 print("Removed CSV file after migration")
-                conn.close()
         except Exception as e:
             print(f"CSV migration failed: {e}")
     else:
@@ -503,92 +784,426 @@ def migrate_csv_to_db():
 
 migrate_csv_to_db()
 
+# Cached players DataFrame. Every write bumps _players_version, so a
+# cache hit can never serve rows older than the last commit.
+_players_lock = threading.Lock()
+_players_version = 0
+_players_cache = {"version": -1, "df": None}
+
+def _bump_players_version():
+    """Invalidate the cached players DataFrame after a database write."""
+    global _players_version
+    with _players_lock:
+        _players_version += 1
+
+_db_data_version = None
+
+def _sync_external_writes():
+    """Invalidate player caches if another process committed to the database.
+
+    PRAGMA data_version on the shared connection only moves for commits made
+    through other connections, e.g. link_photos.py or the sqlite3 shell.
+    """
+    global _db_data_version
+    with _db_lock:
+        data_version = _DB.execute("PRAGMA data_version").fetchone()[0]
+    if data_version != _db_data_version:
+        if _db_data_version is not None:
+            _bump_players_version()
+        _db_data_version = data_version
+
 def load_players():
-    """Load players from SQLite database as pandas DataFrame"""
-    import time, traceback
-    start_time = time.time()
-    # Print caller info
-    stack = traceback.extract_stack()
-    caller = stack[-2]
-    print(f"DEBUG: load_players() called from {caller.filename}:{caller.lineno} in {caller.name}()")
-    conn = sqlite3.connect(DB_FILE)
-    df = pd.read_sql_query("SELECT * FROM players ORDER BY player_id", conn)
-    conn.close()
+    """Load players from SQLite database as pandas DataFrame.
+
+    The data is shared between requests until the next write. Callers get a
+    shallow copy, so adding or reassigning columns is safe, but values must
+    not be written in place.
+    """
+    global _players_cache
+    version = _players_version
+    cached = _players_cache
+    if cached["version"] == version:
+        return cached["df"].copy(deep=False)
+    with _db_lock:
+        df = pd.read_sql_query("SELECT * FROM players ORDER BY player_id", _DB)
     # Replace NaN/None with empty string for display
     df = df.fillna('')
-    end_time = time.time()
-    print(f"DEBUG: load_players() took {end_time - start_time:.3f} seconds, loaded {len(df)} players")
-    return df
+    # Status is stored normalized (three values); as a categorical, status
+    # filters compare small integer codes instead of Python strings
+    df["status"] = df["status"].astype("category")
+    with _players_lock:
+        # Don't cache a read that raced with a write
+        if version == _players_version:
+            _players_cache = {"version": version, "df": df}
+    return df.copy(deep=False)
+
+def unsold_player_ids(df):
+    """player_id array of the unsold rows in a load_players() frame.
+
+    Compares the status column's integer category codes in one NumPy pass
+    rather than matching strings.
+    """
+    status = df["status"].cat
+    try:
+        code = status.categories.get_loc("unsold")
+    except KeyError:
+        return np.empty(0, dtype=df["player_id"].dtype)
+    return df["player_id"].to_numpy()[status.codes.to_numpy() == code]
+
+def _query_rows(sql, params=()):
+    """Run a SELECT on the shared connection and return rows as dicts ('' for NULL)."""
+    with _db_lock:
+        cur = _DB.execute(sql, params)
+        cols = [d[0] for d in cur.description]
+        return [{c: ("" if v is None else v) for c, v in zip(cols, r)} for r in cur]
+
+# Idle read-only connections for streamed responses; at most READ_POOL_SIZE are
+# kept open, extras opened under load are closed when their stream finishes
+READ_POOL_SIZE = 4
+_read_pool = queue.Queue(maxsize=READ_POOL_SIZE)
+
+def _open_read_conn():
+    """Open a read-only connection that may be handed between request threads."""
+    conn = sqlite3.connect(DB_FILE, isolation_level=None, check_same_thread=False)
+    conn.executescript("PRAGMA query_only = ON; PRAGMA busy_timeout=5000;")
+    conn.row_factory = sqlite3.Row
+    return conn
+
+def _iter_rows(sql, params=()):
+    """Yield sqlite3.Row results lazily from a pooled read connection.
+
+    For streamed responses: WAL lets this reader run alongside writes on the
+    shared connection without holding _db_lock for the whole render. The
+    connection goes back to the pool when the stream ends or is closed.
+    """
+    try:
+        conn = _read_pool.get_nowait()
+    except queue.Empty:
+        conn = _open_read_conn()
+    try:
+        cur = conn.execute(sql, params)
+        try:
+            yield from cur
+        finally:
+            cur.close()
+    finally:
+        try:
+            _read_pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+def get_player(player_id):
+    """Fetch one player row by id with an indexed lookup, or None."""
+    rows = _query_rows("SELECT * FROM players WHERE player_id = ?", (int(player_id),))
+    return rows[0] if rows else None
+
+_rows_cache = {"version": -1, "rows": None}
+
+def load_players_rows():
+    """Load players as a list of dicts ordered by player_id.
 
-def save_players(df):
-    """Save players DataFrame to SQLite database"""
-    conn = sqlite3.connect(DB_FILE)
-    df.to_sql('players', conn, if_exists='replace', index=False)
-    conn.close()
+    Cheaper than load_players() for read paths that just filter or sum;
+    NULLs come back as '' to match the DataFrame. Cached on the same
+    version counter, so the rows are shared and must not be mutated.
+    """
+    global _rows_cache
+    version = _players_version
+    cached = _rows_cache
+    if cached["version"] == version:
+        return cached["rows"]
+    rows = _query_rows("SELECT * FROM players ORDER BY player_id")
+    with _players_lock:
+        if version == _players_version:
+            _rows_cache = {"version": version, "rows": rows}
+    return rows
+
+_by_id_cache = (None, {})
+
+def get_players_by_id():
+    """player_id -> row dict over load_players_rows(), rebuilt when the rows change."""
+    global _by_id_cache
+    rows = load_players_rows()
+    cached_rows, index = _by_id_cache
+    if cached_rows is rows:
+        return index
+    index = {r["player_id"]: r for r in rows}
+    _by_id_cache = (rows, index)
+    return index
+
+_by_name_cache = (None, {})
+
+def get_player_ids_by_name():
+    """name -> lowest player_id with that name, rebuilt when the rows change."""
+    global _by_name_cache
+    rows = load_players_rows()
+    cached_rows, index = _by_name_cache
+    if cached_rows is rows:
+        return index
+    index = {}
+    for r in rows:
+        index.setdefault(r["name"], r["player_id"])
+    _by_name_cache = (rows, index)
+    return index
+
+_agg_cache = {"version": -1, "totals": None}
+
+def get_team_aggregates():
+    """Per-team spend and sold/captain counts, grouped inside SQLite.
+
+    Returns {team: {"spent", "sold", "captain"}}; cached on the players
+    version counter so repeated calls within a request are free.
+    """
+    global _agg_cache
+    version = _players_version
+    cached = _agg_cache
+    if cached["version"] == version:
+        return cached["totals"]
+    with _db_lock:
+        cur = _DB.execute(
+            "SELECT team,"
+            " SUM(CAST(sold_price AS INTEGER)),"
+            " SUM(status = 'sold'),"
+            " SUM(status = 'captain')"
+            " FROM players GROUP BY team"
+        )
+        totals = {
+            team: {"spent": spent or 0, "sold": sold or 0, "captain": captain or 0}
+            for team, spent, sold, captain in cur
+        }
+    with _players_lock:
+        if version == _players_version:
+            _agg_cache = {"version": version, "totals": totals}
+    return totals
+
+_team_state_cache = {"key": None, "state": None}
+
+def get_team_state():
+    """Squad size per team (sold + captain), per-team budget snapshot and
+    whether any team is one short of max.
+
+    Derived from get_team_aggregates() and cached until the players or the
+    config change, so the last-slot rule costs a dict lookup per bid and
+    pages render budgets without re-deriving them. Treat as read-only.
+    """
+    global _team_state_cache
+    key = (_players_version, config_version)
+    cached = _team_state_cache
+    if cached["key"] == key:
+        return cached["state"]
+    cfg = CURRENT
+    totals = get_team_aggregates()
+    max_players_allowed = cfg.CONFIG["teams"].get("max_players", 9)
+    counts = {}
+    budgets = {}
+    for team in cfg.TEAMS:
+        t = totals.get(team)
+        counts[team] = t["sold"] + t["captain"] if t else 0
+        spent = int(t["spent"]) if t else 0
+        budgets[team] = {
+            "spent": spent,
+            "remaining": cfg.TEAM_BUDGET - spent,
+            "players": counts[team],
+        }
+    state = {
+        "counts": counts,
+        "budgets": budgets,
+        "caps": team_bid_caps(totals),
+        "last_slot": any(c == max_players_allowed - 1 for c in counts.values()),
+    }
+    with _players_lock:
+        if key == (_players_version, config_version):
+            _team_state_cache = {"key": key, "state": state}
+    return state
+
+# UPDATE text per sorted column tuple; identical text lets sqlite3 reuse its
+# compiled statement
+_UPDATE_STMT_CACHE = {}
+
+# Text columns for CSV import; numeric ones (player_id, base_price, sold_price) are inferred
+CSV_TEXT_DTYPES = {c: str for c in PLAYER_FIELDS if c not in ("player_id", "base_price", "sold_price")}
+
+_INSERT_PLAYER_SQL = (
+    f"INSERT INTO players ({', '.join(PLAYER_FIELDS)}) "
+    f"VALUES ({', '.join('?' * len(PLAYER_FIELDS))})"
+)
+# Same insert with player_id allocated in SQL, so the read and write are one statement
+_INSERT_NEXT_PLAYER_SQL = (
+    f"INSERT INTO players ({', '.join(PLAYER_FIELDS)}) "
+    f"VALUES ((SELECT COALESCE(MAX(player_id), 0) + 1 FROM players), "
+    f"{', '.join('?' * (len(PLAYER_FIELDS) - 1))})"
+)
+
+def bulk_insert_players(rows, replace_all=False):
+    """Insert player tuples (ordered as PLAYER_FIELDS) in one transaction.
+
+    With replace_all the table is emptied first, as a CSV upload replaces
+    the roster. The players version is bumped once.
+    """
+    with _db_lock:
+        _DB.execute("BEGIN IMMEDIATE")
+        try:
+            if replace_all:
+                _DB.execute("DELETE FROM players")
+            _DB.executemany(_INSERT_PLAYER_SQL, rows)
+        except Exception:
+            _DB.execute("ROLLBACK")
+            raise
+        _DB.execute("COMMIT")
+    _bump_players_version()
 
 def update_player_db(player_id, **kwargs):
     """Update specific player fields - much faster than full save"""
-    conn = sqlite3.connect(DB_FILE)
-    set_clause = ', '.join([f"{k} = ?" for k in kwargs.keys()])
-    values = list(kwargs.values()) + [player_id]
-    conn.execute(f"UPDATE players SET {set_clause} WHERE player_id = ?", values)
-    conn.commit()
-    conn.close()
+    if "status" in kwargs:
+        kwargs["status"] = normalize_status(kwargs["status"])
+    columns = tuple(sorted(kwargs))
+    sql = _UPDATE_STMT_CACHE.get(columns)
+    if sql is None:
+        unknown = set(columns) - PLAYER_COLUMNS
+        if unknown:
+            raise ValueError(f"Unknown player field(s): {', '.join(sorted(unknown))}")
+        set_clause = ', '.join(f"{c} = ?" for c in columns)
+        sql = _UPDATE_STMT_CACHE[columns] = f"UPDATE players SET {set_clause} WHERE player_id = ?"
+    values = [kwargs[c] for c in columns]
+    values.append(player_id)
+    _submit_write(sql, values)
+
+# Player updates are funneled through one writer thread, which commits
+# whatever has queued up in a single transaction. A burst of bids/sells
+# becomes one commit instead of one per statement.
+WRITE_BATCH_MAX = 64
+WRITE_WAIT_POLL = 1.0  # seconds between writer liveness checks while waiting
+_write_queue = queue.Queue()
+_writer_thread = None
+_writer_start_lock = threading.Lock()
+
+class _WriteRequest:
+    __slots__ = ("sql", "params", "done", "error")
+
+    def __init__(self, sql, params):
+        self.sql = sql
+        self.params = params
+        self.done = threading.Event()
+        self.error = None
+
+def _submit_write(sql, params):
+    """Queue one statement for the writer thread and wait until it is committed."""
+    _ensure_writer()
+    req = _WriteRequest(sql, params)
+    _write_queue.put(req)
+    while not req.done.wait(WRITE_WAIT_POLL):
+        # Never block forever on a writer that is no longer running
+        if not _writer_thread.is_alive():
+            raise RuntimeError("Player writer thread stopped before committing the update")
+    if req.error is not None:
+        raise req.error
+
+def _ensure_writer():
+    # Started on first use so a pre-fork server spawns it in each worker
+    global _writer_thread
+    if _writer_thread is not None and _writer_thread.is_alive():
+        return
+    with _writer_start_lock:
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(target=_writer_loop, name="players-writer", daemon=True)
+            _writer_thread.start()
+
+def _writer_loop():
+    while True:
+        batch = [_write_queue.get()]
+        while len(batch) < WRITE_BATCH_MAX:
+            try:
+                batch.append(_write_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            _apply_write_batch(batch)
+        except Exception:
+            # _apply_write_batch has already failed and released every request
+            app.logger.exception("Player write batch failed")
+
+def _apply_write_batch(batch):
+    """Run a batch in one transaction; a failing statement only rolls back itself.
+
+    Any exception (not just sqlite3.Error - e.g. OverflowError binding a huge
+    int) is handed back to its caller, and every request is released.
+    """
+    try:
+        with _db_lock:
+            try:
+                _DB.execute("BEGIN IMMEDIATE")
+                for req in batch:
+                    _DB.execute("SAVEPOINT write_req")
+                    try:
+                        _DB.execute(req.sql, req.params)
+                    except Exception as e:
+                        _DB.execute("ROLLBACK TO write_req")
+                        req.error = e
+                    _DB.execute("RELEASE write_req")
+                _DB.execute("COMMIT")
+            except Exception as e:
+                if _DB.in_transaction:
+                    _DB.execute("ROLLBACK")
+                for req in batch:
+                    req.error = req.error or e
+    finally:
+        # Readers must see the new version before any caller is released
+        _bump_players_version()
+        for req in batch:
+            req.done.set()
 
 @app.route("/health")
 def health():
-    return {"status": "ok", "timestamp": datetime.now().isoformat()}
+    return Response(_dumps({"status": "ok", "timestamp": datetime.now().isoformat()}), mimetype="application/json")
 
 @app.route("/")
 def index():
-    df = load_players()
-    auction_players = df[df["status"].astype(str).str.lower() != "captain"]
-    total = len(auction_players)
-    sold = (auction_players["status"].astype(str).str.lower() == "sold").sum()
+    total = sold = 0
+    for r in load_players_rows():
+        status = r["status"]
+        if status == "captain":
+            continue
+        total += 1
+        if status == "sold":
+            sold += 1
     unsold = total - sold
     return render_template("index.html", total=total, sold=sold, unsold=unsold)
 
 @app.route("/teams")
 def teams():
-    import time
-    start_time = time.time()
-    print(f"DEBUG: teams() route called")
-    df = load_players()
+    cfg = CURRENT
+    # Bucket players by team in one pass
+    players_by_team = {team: [] for team in cfg.TEAMS}
+    for r in load_players_rows():
+        bucket = players_by_team.get(r["team"])
+        if bucket is not None:
+            bucket.append(r)
     
     team_data = {}
-    for team in TEAMS:
-        team_players = df[df["team"] == team].to_dict(orient="records")
+    for team in cfg.TEAMS:
+        team_players = players_by_team[team]
         # Sort players to show captain first
         team_players.sort(key=lambda x: (x.get("status", "") != "captain", x.get("name", "")))
-        spent = pd.to_numeric(df[df["team"] == team]["sold_price"], errors="coerce").fillna(0).sum()
+        spent = sum(_to_int(p["sold_price"]) for p in team_players)
         team_data[team] = {
             "players": team_players,
             "count": len(team_players),
             "spent": int(spent),
-            "remaining": TEAM_BUDGET - int(spent)
+            "remaining": cfg.TEAM_BUDGET - int(spent)
         }
     
-    end_time = time.time()
-    print(f"DEBUG: teams() route took {end_time - start_time:.3f} seconds")
-    return render_template("teams.html", team_data=team_data, total_budget=TEAM_BUDGET)
+    return render_template("teams.html", team_data=team_data, total_budget=cfg.TEAM_BUDGET)
+
+SORTABLE_PLAYER_COLUMNS = PLAYER_COLUMNS - {"photo"}
 
 @app.route("/players")
 def players():
-    import time
-    start_time = time.time()
-    print(f"DEBUG: Starting players route")
-    df = load_players()
     sort = request.args.get("sort", "player_id")
     asc = request.args.get("asc", "1") == "1"
-    if sort in df.columns:
-        try:
-            df = df.sort_values(by=sort, ascending=asc)
-        except Exception:
-            pass
-    players = df.to_dict(orient="records")
-    end_time = time.time()
-    print(f"DEBUG: players route took {end_time - start_time:.3f} seconds total")
-    return render_template("players.html", players=players, sort=sort, asc=asc)
+    # Only whitelisted column names are ever interpolated into the query
+    column = sort if sort in SORTABLE_PLAYER_COLUMNS else "player_id"
+    rows = _iter_rows(f"SELECT * FROM players ORDER BY {column} {'ASC' if asc else 'DESC'}, player_id")
+    # Stream so rendering overlaps the download and rows never sit in a list
+    return Response(stream_template("players.html", players=rows, sort=sort, asc=asc))
 
 @app.route("/admin", methods=["GET", "POST"])
 def admin():
@@ -610,119 +1225,108 @@ def admin():
     return render_template("admin_login.html")
 
 @app.route("/auction", methods=["GET", "POST"])
+@admin_only
 def auction():
-    # Check admin access
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    df = load_players()
+    cfg = CURRENT
 
     if request.method == "POST":
-        try:
-            pid = int(request.form.get("player_id"))
-        except (TypeError, ValueError):
-            flash("Invalid player_id", "error")
-            return redirect(url_for("auction"))
-
-        action = request.form.get("action")
-        if action == "sell":
-            team = (request.form.get("team") or "").strip()
-            price_raw = (request.form.get("sold_price") or "").replace(",", "").strip()
+        with _auction_lock:
             try:
-                sold_price = int(float(price_raw))
-            except ValueError:
-                flash("Enter a valid sold price (number).", "error")
+                pid = int(request.form.get("player_id"))
+            except (TypeError, ValueError):
+                flash("Invalid player_id", "error")
                 return redirect(url_for("auction"))
 
-            idx = df.index[df["player_id"] == pid]
-            if len(idx) == 0:
-                flash("Player not found.", "error")
-                return redirect(url_for("auction"))
-            i = idx[0]
-            if str(df.at[i, "status"]).lower() == "sold":
-                flash("Player already sold.", "warning")
-            else:
-                # Check budget and minimum players requirement
-                team_spent = pd.to_numeric(df[df["team"] == team]["sold_price"], errors="coerce").fillna(0).sum()
-                team_players = len(df[(df["team"] == team) & (df["status"].str.lower().isin(["sold", "captain"]))])
-                
-                # Flexible squad completion logic (8-9 players per team)
-                current_players = len(df[(df["team"] == team) & (df["status"].str.lower().isin(["sold", "captain"]))])
-                
-                # Check if team can still buy more players (max 9 per team)
-                if current_players >= 9:
-                    flash(f"{team} already has maximum 9 players!", "error")
+            action = request.form.get("action")
+            if action == "sell":
+                team = (request.form.get("team") or "").strip()
+                price_raw = (request.form.get("sold_price") or "").replace(",", "").strip()
+                try:
+                    sold_price = int(float(price_raw))
+                except ValueError:
+                    flash("Enter a valid sold price (number).", "error")
+                    return redirect(url_for("auction"))
+
+                if team not in cfg.TEAMS_SET:
+                    flash("Unknown team.", "error")
+                    return redirect(url_for("auction"))
+
+                player = get_players_by_id().get(pid)
+                if player is None:
+                    flash("Player not found.", "error")
                     return redirect(url_for("auction"))
+                if player["status"] == "sold":
+                    flash("Player already sold.", "warning")
+                else:
+                    # Check budget and minimum players requirement
+                    team_totals = get_team_aggregates().get(team, {"spent": 0, "sold": 0, "captain": 0})
+                    team_spent = team_totals["spent"]
                 
-                # Calculate remaining players needed (minimum 8, can go up to 9)
-                total_players_left = len(df[df["status"].astype(str).str.lower() == "unsold"]) - 1  # Excluding this player
-                total_assigned = sum(len(df[(df["team"] == t) & (df["status"].str.lower().isin(["sold", "captain"]))]) for t in TEAMS)
+                    # Flexible squad completion logic (8-9 players per team)
+                    current_players = team_totals["sold"] + team_totals["captain"]
                 
-                # Ensure this team gets at least 8 players, but allow flexibility for 9
-                min_needed = max(0, 8 - (current_players + 1))  # Minimum after this purchase
-                players_needed_after_this = min_needed
+                    # Check if team can still buy more players (max 9 per team)
+                    if current_players >= 9:
+                        flash(f"{team} already has maximum 9 players!", "error")
+                        return redirect(url_for("auction"))
                 
-                # Calculate max allowed bid
-                remaining_budget = TEAM_BUDGET - team_spent
-                max_allowed_bid = remaining_budget - (players_needed_after_this * BASE_PRICE)
+                    # Ensure this team gets at least 8 players, but allow flexibility for 9
+                    min_needed = max(0, 8 - (current_players + 1))  # Minimum after this purchase
+                    players_needed_after_this = min_needed
                 
-                # Validate bid
-                if team_spent + sold_price > TEAM_BUDGET:
-                    flash(f"{team} budget exceeded! Remaining: ₹{format_indian_currency(remaining_budget)}", "error")
-                elif sold_price > max_allowed_bid:
-                    flash(
-                        f"Max bid allowed: ₹{format_indian_currency(max_allowed_bid)} "
-                        f"(Need ₹{format_indian_currency(players_needed_after_this * BASE_PRICE)} for {players_needed_after_this} more players)",
-                        "error",
-                    )
-                else:
-                    player_name = df.at[i, 'name']  # Get name before update
-                    update_player_db(pid, team=team, status="sold", sold_price=sold_price, sold_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-                    # Set announcement for public live view and broadcast
-                    current_auction["announcement"] = f"SOLD! {player_name} to {team} for ₹{format_indian_currency(sold_price)}"
-                    current_auction["player_sold"] = True
-                    broadcast_state()
-                    flash(f"Sold player #{pid} to {team} for ₹{format_indian_currency(sold_price)}.", "success")
-
-        elif action == "revert":
-            idx = df.index[df["player_id"] == pid]
-            if len(idx) == 0:
-                flash("Player not found.", "error")
-                return redirect(url_for("auction"))
-            i = idx[0]
-            update_player_db(pid, status="unsold", team="", sold_price=0, sold_at="")
-            broadcast_state()
-            flash(f"Reverted sale for player #{pid}.", "info")
+                    # Calculate max allowed bid
+                    remaining_budget = cfg.TEAM_BUDGET - team_spent
+                    max_allowed_bid = remaining_budget - (players_needed_after_this * cfg.BASE_PRICE)
+                
+                    # Validate bid
+                    if team_spent + sold_price > cfg.TEAM_BUDGET:
+                        flash(f"{team} budget exceeded! Remaining: ₹{format_indian_currency(remaining_budget)}", "error")
+                    elif sold_price > max_allowed_bid:
+                        flash(
+                            f"Max bid allowed: ₹{format_indian_currency(max_allowed_bid)} "
+                            f"(Need ₹{format_indian_currency(players_needed_after_this * cfg.BASE_PRICE)} for {players_needed_after_this} more players)",
+                            "error",
+                        )
+                    else:
+                        player_name = player['name']  # Get name before update
+                        update_player_db(pid, team=team, status="sold", sold_price=sold_price, sold_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+                        # Set announcement for public live view and broadcast
+                        current_auction["announcement"] = f"SOLD! {player_name} to {team} for ₹{format_indian_currency(sold_price)}"
+                        current_auction["player_sold"] = True
+                        schedule_broadcast()
+                        flash(f"Sold player #{pid} to {team} for ₹{format_indian_currency(sold_price)}.", "success")
+
+            elif action == "revert":
+                if pid not in get_players_by_id():
+                    flash("Player not found.", "error")
+                    return redirect(url_for("auction"))
+                update_player_db(pid, status="unsold", team="", sold_price=0, sold_at="")
+                schedule_broadcast()
+                flash(f"Reverted sale for player #{pid}.", "info")
 
-        return redirect(url_for("auction"))
+            return redirect(url_for("auction"))
 
     # GET - Calculate team budgets and player counts
+    rows = load_players_rows()
     team_spending = {}
-    for team in TEAMS:
-        spent = pd.to_numeric(df[df["team"] == team]["sold_price"], errors="coerce").fillna(0).sum()
-        players = len(df[(df["team"] == team) & (df["status"].str.lower().isin(["sold", "captain"]))])
+    for team, budget in get_team_state()["budgets"].items():
+        players = budget["players"]
         # Flexible team sizes (8-9 players)
         min_players = min(9, players + 1) if players < 8 else 9
-        team_spending[team] = {
-            "spent": int(spent), 
-            "remaining": TEAM_BUDGET - int(spent),
-            "players": players,
-            "min_players": min_players
-        }
+        team_spending[team] = {**budget, "min_players": min_players}
     
-    players_unsold = df[(df["status"].astype(str).str.lower() != "sold") & (df["status"].astype(str).str.lower() != "captain")].to_dict(orient="records")
-    players_sold = df[df["status"].astype(str).str.lower() == "sold"].to_dict(orient="records")
+    players_unsold, players_sold = split_sold_unsold(rows)
 
     # Optional: current live bidding context for quick-bid controls on admin page
     current_player = None
     team_limits = None
     next_bid = None
     if current_auction.get("player_id"):
-        row = df[df["player_id"] == current_auction["player_id"]]
-        if not row.empty:
-            current_player = row.iloc[0].to_dict()
+        current_player = get_players_by_id().get(current_auction["player_id"])
+        if current_player is not None:
             if (current_auction.get("status") or "").lower() in ("bidding", "going"):
                 team_limits = compute_team_limits(
-                    df,
+                    get_team_aggregates(),
                     current_player,
                     current_auction.get("current_bid", 0),
                     current_team=current_auction.get("current_team", ""),
@@ -738,53 +1342,42 @@ def auction():
         players_unsold=players_unsold,
         players_sold=players_sold,
         team_budgets=team_spending,
-        total_budget=TEAM_BUDGET,
-        base_price=BASE_PRICE,
+        total_budget=cfg.TEAM_BUDGET,
+        base_price=cfg.BASE_PRICE,
         is_admin=True,
         current_player=current_player,
         auction_state=current_auction,
         team_limits=team_limits,
         next_bid=next_bid,
-        teams=TEAMS,
+        teams=cfg.TEAMS,
     )
 
 @app.route("/results")
 def results():
     """Public view for audience - no admin controls"""
-    df = load_players()
-    
-    # Calculate team budgets and player counts
-    team_spending = {}
-    for team in TEAMS:
-        spent = pd.to_numeric(df[df["team"] == team]["sold_price"], errors="coerce").fillna(0).sum()
-        players = len(df[(df["team"] == team) & (df["status"].str.lower().isin(["sold", "captain"]))])
-        min_players = 8
-        team_spending[team] = {
-            "spent": int(spent), 
-            "remaining": TEAM_BUDGET - int(spent),
-            "players": players,
-            "min_players": min_players
-        }
+    cfg = CURRENT
+    rows = load_players_rows()
+    # Team budgets and player counts
+    team_spending = {team: {**budget, "min_players": 8}
+                     for team, budget in get_team_state()["budgets"].items()}
     
-    players_unsold = df[(df["status"].astype(str).str.lower() != "sold") & (df["status"].astype(str).str.lower() != "captain")].to_dict(orient="records")
-    players_sold = df[df["status"].astype(str).str.lower() == "sold"].to_dict(orient="records")
-    return render_template("auction.html", players_unsold=players_unsold, players_sold=players_sold, team_budgets=team_spending, total_budget=TEAM_BUDGET, is_admin=False, sold_first=True)
+    players_unsold, players_sold = split_sold_unsold(rows)
+    return render_template("auction.html", players_unsold=players_unsold, players_sold=players_sold, team_budgets=team_spending, total_budget=cfg.TEAM_BUDGET, is_admin=False, sold_first=True)
 
 
 
 @app.route("/live-view")
 def live_view():
     """Public live view of current bidding"""
-    df = load_players()
     current_player = None
     team_limits = None
     starting_team = compute_starting_team()
     if current_auction["player_id"]:
-        current_player = df[df["player_id"] == current_auction["player_id"]].iloc[0].to_dict()
+        current_player = get_players_by_id().get(current_auction["player_id"])
         # Only compute team limits if still in bidding/going state
-        if (current_auction.get("status") or "").lower() not in ("sold", "waiting"):
+        if current_player is not None and (current_auction.get("status") or "").lower() not in ("sold", "waiting"):
             team_limits = compute_team_limits(
-                df,
+                get_team_aggregates(),
                 current_player,
                 current_auction.get("current_bid", 0),
                 current_team=current_auction.get("current_team", ""),
@@ -793,33 +1386,29 @@ def live_view():
     return render_template("live_view.html", current_player=current_player, auction_state=current_auction, team_limits=team_limits, starting_team=starting_team, auction_version=auction_version)
 
 @app.route("/start-sequential", methods=["POST"])
+@admin_only
+@with_auction_lock
 def start_sequential():
-    # Check admin access
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    
+    cfg = CURRENT
     df = load_players()
     # Get all unsold players (excluding captains)
-    unsold_players = df[(df["status"].astype(str).str.lower() == "unsold")]
+    unsold_ids = unsold_player_ids(df)
     
-    if len(unsold_players) == 0:
+    if len(unsold_ids) == 0:
         flash("No unsold players available for sequential auction!", "error")
         return redirect(url_for("auction"))
     
     # Check for custom order
     custom_order = request.form.get('custom_order')
     if custom_order:
-        import json
-        player_names = json.loads(custom_order)
         # Convert names to player IDs
-        player_sequence = []
-        for name in player_names:
-            player_row = df[df['name'] == name]
-            if not player_row.empty:
-                player_sequence.append(player_row.iloc[0]['player_id'])
+        ids_by_name = get_player_ids_by_name()
+        player_sequence = np.fromiter(
+            (ids_by_name[name] for name in _loads(custom_order) if name in ids_by_name), dtype=np.int32
+        )
     else:
         # Use default strategic sequence
-        player_sequence = unsold_players["player_id"].tolist()
+        player_sequence = unsold_ids.astype(np.int32)
     
     # Initialize sequential auction
     sequential_auction["active"] = True
@@ -828,78 +1417,65 @@ def start_sequential():
     
     # Clear any previous announcement and set first player as current
     current_auction["announcement"] = None
-    first_player_id = sequential_auction["player_sequence"][0]
-    first_player_row = df[df["player_id"] == first_player_id]
-    first_player_base_price = int(first_player_row.iloc[0]["base_price"]) if not first_player_row.empty else BASE_PRICE
+    current_auction["history"].clear()
+    first_player_id = int(sequential_auction["player_sequence"][0])
+    first_player = get_players_by_id().get(first_player_id)
+    first_player_base_price = int(first_player["base_price"]) if first_player is not None else cfg.BASE_PRICE
     current_auction["player_id"] = first_player_id
     current_auction["current_bid"] = first_player_base_price
     current_auction["current_team"] = ""
     current_auction["status"] = "bidding"
-    broadcast_state()
+    schedule_broadcast()
     
     flash(f"Sequential auction started! {len(sequential_auction['player_sequence'])} players in queue.", "success")
     return redirect(url_for("sequential_auction_page"))
 
 @app.route("/sequential-auction", methods=["GET", "POST"])
+@admin_only
 def sequential_auction_page():
-    import time
-    start_time = time.time()
-    print(f"DEBUG: sequential_auction_page() called")
-    # Check admin access
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    
     if not sequential_auction["active"]:
         flash("No sequential auction in progress!", "error")
         return redirect(url_for("auction"))
     
     # Handle POST requests (update_bid action)
     if request.method == "POST":
-        action = request.form.get("action")
-        if action == "update_bid":
-            team = request.form.get("team")
-            bid_amount_str = request.form.get("bid_amount", "").strip()
+        with _auction_lock:
+            action = request.form.get("action")
+            if action == "update_bid":
+                team = request.form.get("team")
+                bid_amount_str = request.form.get("bid_amount", "").strip()
             
-            if not team or not bid_amount_str:
-                flash("Team and bid amount are required", "error")
-                return redirect(url_for("sequential_auction_page"))
+                if not team or not bid_amount_str:
+                    flash("Team and bid amount are required", "error")
+                    return redirect(url_for("sequential_auction_page"))
             
-            try:
-                # Parse currency input (supports formats like "1.05Cr", "65L", or plain numbers)
-                bid_amount = parse_currency_input(bid_amount_str)
+                try:
+                    # Parse currency input (supports formats like "1.05Cr", "65L", or plain numbers)
+                    bid_amount = parse_currency_input(bid_amount_str)
                 
-                if bid_amount <= 0:
-                    flash("Bid amount must be positive", "error")
-                    return redirect(url_for("sequential_auction_page"))
+                    if bid_amount <= 0:
+                        flash("Bid amount must be positive", "error")
+                        return redirect(url_for("sequential_auction_page"))
                 
-                # Update current auction state
-                current_auction["current_bid"] = bid_amount
-                current_auction["current_team"] = team
-                current_auction["status"] = "bidding"
-                broadcast_state()
+                    # Update current auction state
+                    current_auction["current_bid"] = bid_amount
+                    current_auction["current_team"] = team
+                    current_auction["status"] = "bidding"
+                    schedule_broadcast()
                 
-                flash(f"Bid updated: {team} - ₹{format_indian_currency(bid_amount)}", "success")
-            except (ValueError, TypeError) as e:
-                flash(f"Invalid bid amount format: {str(e)}", "error")
+                    flash(f"Bid updated: {team} - ₹{format_indian_currency(bid_amount)}", "success")
+                except (ValueError, TypeError) as e:
+                    flash(f"Invalid bid amount format: {str(e)}", "error")
             
-            return redirect(url_for("sequential_auction_page"))
+                return redirect(url_for("sequential_auction_page"))
     
-    df = load_players()
+    cfg = CURRENT
     current_player = None
     
     if current_auction["player_id"]:
-        current_player = df[df["player_id"] == current_auction["player_id"]].iloc[0].to_dict()
+        current_player = get_players_by_id().get(current_auction["player_id"])
     
-    # Calculate team budgets
-    team_spending = {}
-    for team in TEAMS:
-        spent = pd.to_numeric(df[df["team"] == team]["sold_price"], errors="coerce").fillna(0).sum()
-        players = len(df[(df["team"] == team) & (df["status"].str.lower().isin(["sold", "captain"]))])
-        team_spending[team] = {
-            "spent": int(spent), 
-            "remaining": TEAM_BUDGET - int(spent),
-            "players": players
-        }
+    team_spending = get_team_state()["budgets"]
     
     progress = {
         "current": sequential_auction["current_index"] + 1,
@@ -909,7 +1485,7 @@ def sequential_auction_page():
     next_bid = None
     if current_player:
         team_limits = compute_team_limits(
-            df,
+            get_team_aggregates(),
             current_player,
             current_auction.get("current_bid", 0),
             current_team=current_auction.get("current_team", ""),
@@ -920,183 +1496,150 @@ def sequential_auction_page():
             bool(current_auction.get("current_team")),
         )
     
-    end_time = time.time()
-    print(f"DEBUG: sequential_auction_page() took {end_time - start_time:.3f} seconds")
     return render_template("sequential_auction.html", 
                          current_player=current_player, 
                          auction_state=current_auction,
                          team_budgets=team_spending,
-                         teams=TEAMS,
+                         teams=cfg.TEAMS,
                          progress=progress,
                          starting_team=compute_starting_team(),
                          team_limits=team_limits,
                          next_bid=next_bid)
 
 @app.route("/end-sequential", methods=["POST"])
+@admin_only
+@with_auction_lock
 def end_sequential():
-    # Check admin access
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    
     # End sequential auction
     sequential_auction["active"] = False
     current_auction["player_id"] = None
     current_auction["status"] = "waiting"
     current_auction["announcement"] = None
-    broadcast_state()
+    schedule_broadcast()
     
     flash("Sequential auction ended manually.", "info")
     return redirect(url_for("auction"))
 
 @app.route("/next-player", methods=["POST"])
+@admin_only
+@with_auction_lock
 def next_player():
-    import time
-    start_time = time.time()
-    print(f"DEBUG: next_player() called")
-    # Check admin access
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    
     if not sequential_auction["active"]:
         flash("No sequential auction in progress!", "error")
         return redirect(url_for("auction"))
     
+    cfg = CURRENT
     # Move to next player
     sequential_auction["current_index"] += 1
     
     if sequential_auction["current_index"] >= len(sequential_auction["player_sequence"]):
         # End of round - check if any auctionable players remain
         df = load_players()
-        unsold_players = df[(df["status"].astype(str).str.lower() == "unsold")]
-        # Check if all auctionable players (excluding captains) are sold
-        auctionable_players = df[df["status"].astype(str).str.lower() != "captain"]
-        sold_players = auctionable_players[auctionable_players["status"].astype(str).str.lower() == "sold"]
+        # Any unsold player means some auctionable (non-captain) player is
+        # still not sold
+        unsold_ids = unsold_player_ids(df)
         
-        if len(unsold_players) > 0 and len(sold_players) < len(auctionable_players):
+        if len(unsold_ids) > 0:
             sequential_auction["current_index"] = 0
-            sequential_auction["player_sequence"] = unsold_players["player_id"].tolist()
-            next_player_id = sequential_auction["player_sequence"][0]
-            next_player_row = df[df["player_id"] == next_player_id]
-            next_player_base_price = int(next_player_row.iloc[0]["base_price"]) if not next_player_row.empty else BASE_PRICE
+            sequential_auction["player_sequence"] = unsold_ids.astype(np.int32)
+            next_player_id = int(sequential_auction["player_sequence"][0])
+            next_player = get_players_by_id().get(next_player_id)
+            next_player_base_price = int(next_player["base_price"]) if next_player is not None else cfg.BASE_PRICE
             current_auction["player_id"] = next_player_id
             current_auction["current_bid"] = next_player_base_price
             current_auction["current_team"] = ""
             current_auction["status"] = "bidding"
             # Broadcast for live view updates
-            broadcast_state()
+            schedule_broadcast()
             flash("New round started for remaining unsold players.", "info")
             return redirect(url_for("sequential_auction_page"))
         # Auction complete
         sequential_auction["active"] = False
         current_auction["player_id"] = None
         current_auction["status"] = "waiting"
-        broadcast_state()
+        schedule_broadcast()
         flash("Sequential auction completed! All players processed.", "success")
         return redirect(url_for("auction"))
     
     # Clear any previous announcement and set next player
     current_auction["announcement"] = None
-    current_auction["history"] = []  # Clear bid history
+    current_auction["history"].clear()  # Clear bid history
     current_auction["player_sold"] = False  # Reset sold flag
-    # Clear cache since auction state changed
-    _payload_cache["df"] = None
-    next_player_id = sequential_auction["player_sequence"][sequential_auction["current_index"]]
-    df = load_players()
-    next_player_row = df[df["player_id"] == next_player_id]
-    next_player_base_price = int(next_player_row.iloc[0]["base_price"]) if not next_player_row.empty else BASE_PRICE
+    next_player_id = int(sequential_auction["player_sequence"][sequential_auction["current_index"]])
+    next_player = get_players_by_id().get(next_player_id)
+    next_player_base_price = int(next_player["base_price"]) if next_player is not None else cfg.BASE_PRICE
     current_auction["player_id"] = next_player_id
     current_auction["current_bid"] = next_player_base_price
     current_auction["current_team"] = ""
     current_auction["status"] = "bidding"
     # Broadcast for live view updates
-    broadcast_state()
+    schedule_broadcast()
     
-    end_time = time.time()
-    print(f"DEBUG: next_player() completed in {end_time - start_time:.3f} seconds")
     flash("Next player loaded!", "info")
     return redirect(url_for("sequential_auction_page"))
 
 @app.route("/reset-captains", methods=["POST"])
+@admin_only
 def reset_captains():
-    # Check admin access
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    
     # Reset captains to unsold players directly in database
-    conn = sqlite3.connect(DB_FILE)
-    conn.execute("UPDATE players SET status = 'unsold', team = '', sold_price = 0, sold_at = '' WHERE status = 'captain'")
-    conn.commit()
-    conn.close()
-    broadcast_state()
+    _submit_write("UPDATE players SET status = 'unsold', team = '', sold_price = 0, sold_at = '' WHERE status = 'captain'", ())
+    schedule_broadcast()
     
     flash("All captains reset to unsold players.", "success")
     return redirect(url_for("auction"))
 
 @app.route("/reset", methods=["POST"])
+@admin_only
+@with_auction_lock
 def reset_auction():
-    # Check admin access
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    
     # Reset only sold players, preserve captains - direct database operation
-    conn = sqlite3.connect(DB_FILE)
-    conn.execute("UPDATE players SET status = 'unsold', team = '', sold_price = 0, sold_at = '' WHERE status = 'sold'")
-    conn.commit()
-    conn.close()
+    _submit_write("UPDATE players SET status = 'unsold', team = '', sold_price = 0, sold_at = '' WHERE status = 'sold'", ())
     
     # Reset live auction state
     current_auction["player_id"] = None
     current_auction["current_bid"] = 0
     current_auction["current_team"] = ""
     current_auction["status"] = "waiting"
-    broadcast_state()
+    schedule_broadcast()
     
     flash("Auction reset successfully! All players marked as unsold.", "success")
     return redirect(url_for("auction"))
 
 @app.route("/set-captain", methods=["POST"])
+@admin_only
 def set_captain():
-    # Check admin access
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    
     player_id = int(request.form.get("player_id"))
     team = request.form.get("team")
     
-    df = load_players()
-    
     # Check if team already has a captain
-    existing_captain = df[(df["team"] == team) & (df["status"] == "captain")]
-    if len(existing_captain) > 0:
-        flash(f"{team} already has a captain: {existing_captain.iloc[0]['name']}", "warning")
+    existing_captain = _query_rows(
+        "SELECT name FROM players WHERE team = ? AND status = 'captain' LIMIT 1", (team,)
+    )
+    if existing_captain:
+        flash(f"{team} already has a captain: {existing_captain[0]['name']}", "warning")
         return redirect(url_for("auction"))
     
     # Set new captain
-    idx = df.index[df["player_id"] == player_id]
-    if len(idx) == 0:
+    player = get_players_by_id().get(player_id)
+    if player is None:
         flash("Player not found.", "error")
     else:
-        i = idx[0]
-        player_name = df.at[i, "name"]
+        player_name = player["name"]
         update_player_db(player_id, team=team, status="captain", sold_price=0, sold_at="")
-        broadcast_state()
+        schedule_broadcast()
         flash(f"Set {player_name} as captain of {team}", "success")
     
     return redirect(url_for("auction"))
 
 @app.route("/reset-player/<int:player_id>", methods=["POST"])
+@admin_only
+@with_auction_lock
 def reset_player(player_id):
-    # Check admin access
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    
-    df = load_players()
-    idx = df.index[df["player_id"] == player_id]
-    if len(idx) == 0:
+    player = get_players_by_id().get(player_id)
+    if player is None:
         flash("Player not found.", "error")
     else:
-        i = idx[0]
-        player_name = df.at[i, "name"]
+        player_name = player["name"]
         update_player_db(player_id, status="unsold", team="", sold_price=0, sold_at="")
         
         # Reset live auction if this player was being auctioned
@@ -1105,7 +1648,7 @@ def reset_player(player_id):
             current_auction["current_bid"] = 0
             current_auction["current_team"] = ""
             current_auction["status"] = "waiting"
-            broadcast_state()
+            schedule_broadcast()
         
         flash(f"Reset {player_name} - marked as unsold.", "info")
     
@@ -1118,21 +1661,13 @@ def logout():
     return redirect(url_for("index"))
 
 @app.route("/player-management")
+@admin_only
 def player_management():
-    # Check admin access
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    
-    df = load_players()
-    players = df.to_dict(orient="records")
-    return render_template("player_management.html", players=players)
+    return render_template("player_management.html", players=load_players_rows())
 
 @app.route("/upload-players", methods=["POST"])
+@admin_only
 def upload_players():
-    # Check admin access
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    
     if 'csv_file' not in request.files:
         flash("No file selected", "error")
         return redirect(url_for("player_management"))
@@ -1143,8 +1678,9 @@ def upload_players():
         return redirect(url_for("player_management"))
     
     try:
-        # Read uploaded CSV
-        df = pd.read_csv(file)
+        # Read uploaded CSV; only player columns are parsed and text columns
+        # skip type inference (so an age like 21 stays '21', not 21.0)
+        df = pd.read_csv(file, usecols=lambda c: c in PLAYER_COLUMNS, dtype=CSV_TEXT_DTYPES)
         
         # Validate required columns
         required_cols = ['name', 'role', 'base_price']
@@ -1187,8 +1723,10 @@ def upload_players():
                         # Set to empty if file doesn't exist
                         df.at[idx, 'photo'] = ''
         
-        # Save to database
-        save_players(df)
+        # Save to database; object dtype turns numpy scalars into Python ones
+        df = df.assign(status=df["status"].map(normalize_status))[list(PLAYER_FIELDS)].astype(object)
+        df = df.where(df.notna(), None)
+        bulk_insert_players(df.itertuples(index=False, name=None), replace_all=True)
         
         success_msg = f"Successfully uploaded {len(df)} players"
         if photo_warnings:
@@ -1204,16 +1742,8 @@ def upload_players():
     return redirect(url_for("player_management"))
 
 @app.route("/add-player", methods=["POST"])
+@admin_only
 def add_player():
-    # Check admin access
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    
-    df = load_players()
-    
-    # Get next player ID
-    next_id = df['player_id'].max() + 1 if not df.empty else 1
-    
     # Calculate base price from value + unit
     base_price_value = float(request.form.get('base_price_value'))
     base_price_unit = request.form.get('base_price_unit')
@@ -1221,7 +1751,6 @@ def add_player():
     
     # Create new player
     new_player = {
-        'player_id': next_id,
         'name': request.form.get('name'),
         'role': request.form.get('role'),
         'base_price': base_price,
@@ -1235,27 +1764,21 @@ def add_player():
         'photo': ''
     }
     
-    # Add to dataframe
-    df = pd.concat([df, pd.DataFrame([new_player])], ignore_index=True)
-    save_players(df)
+    _submit_write(_INSERT_NEXT_PLAYER_SQL, tuple(new_player[f] for f in PLAYER_FIELDS[1:]))
     
     flash(f"Added player: {new_player['name']}", "success")
     return redirect(url_for("player_management"))
 
 @app.route("/update-player", methods=["POST"])
+@admin_only
 def update_player_route():
-    # Check admin access
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    
     player_id = int(request.form.get('player_id'))
     field = request.form.get('field')
     value = request.form.get('value')
     
-    df = load_players()
-    idx = df.index[df['player_id'] == player_id]
-    
-    if len(idx) > 0:
+    if field not in PLAYER_COLUMNS or field == 'player_id':
+        flash(f"Unknown field: {field}", "error")
+    elif player_id in get_players_by_id():
         if field == 'base_price':
             value = int(value)
         # Use direct database update instead of DataFrame
@@ -1265,37 +1788,42 @@ def update_player_route():
     return redirect(url_for("player_management"))
 
 @app.route("/delete-player", methods=["POST"])
+@admin_only
 def delete_player():
-    # Check admin access
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    
     player_id = int(request.form.get('player_id'))
-    df = load_players()
-    
-    # Remove player
-    df = df[df['player_id'] != player_id]
-    save_players(df)
+    _submit_write("DELETE FROM players WHERE player_id = ?", (player_id,))
     
     flash(f"Deleted player ID {player_id}", "info")
     return redirect(url_for("player_management"))
 
 @app.route("/reset-all-players", methods=["POST"])
+@admin_only
 def reset_all_players():
-    # Check admin access
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    
-    df = load_players()
-    
     # Reset all players to unsold - direct database operation
-    conn = sqlite3.connect(DB_FILE)
-    conn.execute("UPDATE players SET team = '', status = 'unsold', sold_price = 0, sold_at = ''")
-    conn.commit()
-    conn.close()
+    _submit_write("UPDATE players SET team = '', status = 'unsold', sold_price = 0, sold_at = ''", ())
     flash("Reset all players to unsold status", "info")
     return redirect(url_for("player_management"))
 
+CSV_CHUNK_ROWS = 1000
+
+def _csv_chunks(header, rows):
+    """Yield CSV text a chunk of rows at a time instead of building it all."""
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="\n")
+    writer.writerow(header)
+    for i, row in enumerate(rows, 1):
+        writer.writerow(row)
+        if i % CSV_CHUNK_ROWS == 0:
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+    yield buf.getvalue()
+
+def _csv_response(body, filename):
+    """Send CSV text (or an iterable of chunks) as a download."""
+    return Response(body, mimetype="text/csv",
+                    headers={"Content-Disposition": f"attachment; filename={filename}"})
+
 @app.route("/download-template")
 def download_template():
     # Create sample CSV template
@@ -1310,38 +1838,53 @@ def download_template():
     }
     
     df = pd.DataFrame(template_data)
-    
-    # Create CSV in memory
-    output = io.StringIO()
-    df.to_csv(output, index=False)
-    output.seek(0)
-    
-    # Convert to bytes
-    csv_bytes = io.BytesIO()
-    csv_bytes.write(output.getvalue().encode('utf-8'))
-    csv_bytes.seek(0)
-    
-    return send_file(csv_bytes, mimetype='text/csv', as_attachment=True, download_name='player_template.csv')
+    return _csv_response(df.to_csv(index=False), 'player_template.csv')
 
 @app.route("/export-players")
+@admin_only
 def export_players():
-    # Check admin access
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    
-    df = load_players()
-    
-    # Create CSV in memory
-    output = io.StringIO()
-    df.to_csv(output, index=False)
-    output.seek(0)
-    
-    # Convert to bytes
-    csv_bytes = io.BytesIO()
-    csv_bytes.write(output.getvalue().encode('utf-8'))
-    csv_bytes.seek(0)
-    
-    return send_file(csv_bytes, mimetype='text/csv', as_attachment=True, download_name='players_export.csv')
+    rows = _iter_rows(f"SELECT {', '.join(PLAYER_FIELDS)} FROM players ORDER BY player_id")
+    return _csv_response(_csv_chunks(PLAYER_FIELDS, rows), 'players_export.csv')
+
+# Photo resizing runs on a small pool so concurrent uploads cannot pile up
+# decodes; the request waits for its own result before answering
+_photo_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="photo-resize")
+PHOTO_PROCESS_TIMEOUT = 30  # seconds an upload waits for its resize
+
+def _process_player_photo(data, player_id):
+    """Resize an uploaded photo to 200x200, save it and record it on the player."""
+    try:
+        image = Image.open(io.BytesIO(data))
+        # Let the JPEG decoder downscale by a power of two before resampling
+        image.draft('RGB', (400, 400))
+        
+        # Convert to RGB if necessary
+        if image.mode in ('RGBA', 'P'):
+            image = image.convert('RGB')
+        
+        # Resize to 200x200 maintaining aspect ratio
+        image.thumbnail((200, 200), RESAMPLE_LANCZOS)
+        
+        # Create square image with padding if needed
+        if image.size != (200, 200):
+            new_image = Image.new('RGB', (200, 200), (71, 85, 105))  # Gray background
+            paste_x = (200 - image.size[0]) // 2
+            paste_y = (200 - image.size[1]) // 2
+            new_image.paste(image, (paste_x, paste_y))
+            image = new_image
+        
+        # Save resized image
+        filename = f"player_{player_id}.jpg"
+        file_path = os.path.join(app.static_folder, 'players', filename)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        image.save(file_path, 'JPEG', quality=85, optimize=True)
+        
+        # Update player record with photo filename
+        if int(player_id) in get_players_by_id():
+            update_player_db(int(player_id), photo=filename)
+    except Exception:
+        app.logger.exception("Processing photo for player %s failed", player_id)
+        raise
 
 @app.route("/upload-player-photo", methods=["POST"])
 def upload_player_photo():
@@ -1370,60 +1913,32 @@ def upload_player_photo():
             size_mb = file_size / 1024 / 1024
             return jsonify({"success": False, "error": f"File too large ({size_mb:.2f}MB). Maximum size is 5MB."})
         
-        # Open and resize image
+        # Only the header is parsed here; decoding happens on the photo pool
+        data = file.read()
         try:
-            image = Image.open(file)
+            Image.open(io.BytesIO(data))
         except Exception as e:
             return jsonify({"success": False, "error": "Invalid image file. Please upload a valid image (JPEG, PNG, GIF, etc.)"})
         
-        # Convert to RGB if necessary
-        if image.mode in ('RGBA', 'P'):
-            image = image.convert('RGB')
-        
-        # Resize to 200x200 maintaining aspect ratio
-        image.thumbnail((200, 200), RESAMPLE_LANCZOS)
-        
-        # Create square image with padding if needed
-        if image.size != (200, 200):
-            new_image = Image.new('RGB', (200, 200), (71, 85, 105))  # Gray background
-            paste_x = (200 - image.size[0]) // 2
-            paste_y = (200 - image.size[1]) // 2
-            new_image.paste(image, (paste_x, paste_y))
-            image = new_image
-        
-        # Save resized image
-        filename = f"player_{player_id}.jpg"
-        file_path = os.path.join(app.static_folder, 'players', filename)
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        image.save(file_path, 'JPEG', quality=85, optimize=True)
-        print(f"DEBUG: Saved photo to {file_path}, file exists: {os.path.exists(file_path)}")
-        
-        # Update player record with photo filename
-        df = load_players()
-        idx = df.index[df['player_id'] == int(player_id)]
-        if len(idx) > 0:
-            # Use direct database update instead of DataFrame
-            update_player_db(int(player_id), photo=filename)
-        
+        future = _photo_executor.submit(_process_player_photo, data, int(player_id))
+        try:
+            future.result(timeout=PHOTO_PROCESS_TIMEOUT)
+        except FuturesTimeoutError:
+            return jsonify({"success": False, "error": "Photo processing timed out. Please try again."})
         return jsonify({"success": True, "timestamp": int(time.time())})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)})
 
 @app.route("/tournament-settings")
+@admin_only
 def tournament_settings():
-    # Check admin access
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    
     config = load_config()
     return render_template("tournament_settings.html", config=config)
 
 @app.route("/change-admin-password", methods=["POST"])
+@admin_only
 def change_admin_password():
     """Change admin password with verification"""
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    
     current_password = request.form.get("current_password")
     new_password = request.form.get("new_password")
     confirm_password = request.form.get("confirm_password")
@@ -1471,6 +1986,8 @@ def change_admin_password():
     
     with open(env_path, 'w') as f:
         f.writelines(env_lines)
+    # .env is only read once at startup, so apply the new hash to this process too
+    os.environ["ADMIN_PASSWORD_HASH"] = new_hash
     
     # Log the change
     audit_logger.log_change(
@@ -1485,30 +2002,21 @@ def change_admin_password():
     return redirect(url_for("admin"))
 
 @app.route("/update-tournament-info", methods=["POST"])
+@admin_only
 def update_tournament_info():
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    
     config = load_config()
     config["tournament"]["name"] = request.form.get("tournament_name")
     config["auction"]["currency"] = request.form.get("currency")
     save_config(config)
     
-    # Update global variables
-    global CONFIG
-    CONFIG = config
-    
-    # Update Jinja template globals
-    app.jinja_env.globals.update(CONFIG=CONFIG)
+    publish_config(config)
     
     flash("Tournament information updated", "success")
     return redirect(url_for("tournament_settings"))
 
 @app.route("/upload-logo", methods=["POST"])
+@admin_only
 def upload_logo():
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    
     if 'logo_file' not in request.files:
         flash("No file selected", "error")
         return redirect(url_for("tournament_settings"))
@@ -1518,18 +2026,43 @@ def upload_logo():
         flash("No file selected", "error")
         return redirect(url_for("tournament_settings"))
     
-    # Save logo file
-    filename = secure_filename("logo.png")  # Always save as logo.png
-    file.save(os.path.join(app.static_folder, filename))
+    # Save logo file, always as logo.png
+    save_upload(file.stream, os.path.join(app.static_folder, "logo.png"))
     
     flash("Logo updated successfully", "success")
     return redirect(url_for("tournament_settings"))
 
+UPLOAD_COPY_BUFFER = 1024 * 1024
+
+def save_upload(stream, path):
+    """Copy an uploaded stream to path verbatim.
+
+    Uploads Werkzeug has already spooled to disk are copied in the kernel
+    with sendfile. Small in-memory ones use copyfileobj with a 1 MB buffer;
+    asking them for fileno() would force a rollover to disk first. Platforms
+    where sendfile can't target a regular file fall back to the copy too.
+    """
+    with open(path, "wb") as out:
+        offset = 0
+        if getattr(stream, "_rolled", False) and hasattr(os, "sendfile"):
+            stream.flush()
+            src_fd = stream.fileno()
+            size = os.fstat(src_fd).st_size
+            try:
+                while offset < size:
+                    sent = os.sendfile(out.fileno(), src_fd, offset, size - offset)
+                    if not sent:
+                        break
+                    offset += sent
+                return
+            except OSError:
+                pass
+        stream.seek(offset)
+        shutil.copyfileobj(stream, out, UPLOAD_COPY_BUFFER)
+
 @app.route("/update-teams", methods=["POST"])
+@admin_only
 def update_teams():
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    
     config = load_config()
     
     # Get team names
@@ -1558,23 +2091,14 @@ def update_teams():
     
     save_config(config)
     
-    # Update global variables
-    global CONFIG, TEAMS, TEAM_BUDGET
-    CONFIG = config
-    TEAMS = config["teams"]["names"]
-    TEAM_BUDGET = config["teams"]["budget"]
-    
-    # Update Jinja template globals
-    app.jinja_env.globals.update(CONFIG=CONFIG)
+    publish_config(config)
     
     flash("Team settings updated", "success")
     return redirect(url_for("tournament_settings"))
 
 @app.route("/update-auction-rules", methods=["POST"])
+@admin_only
 def update_auction_rules():
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    
     config = load_config()
     
     # Calculate base price from value + unit
@@ -1595,22 +2119,14 @@ def update_auction_rules():
     
     save_config(config)
     
-    # Update global variables
-    global CONFIG, BASE_PRICE
-    CONFIG = config
-    BASE_PRICE = config["auction"]["base_price"]
-    
-    # Update Jinja template globals
-    app.jinja_env.globals.update(CONFIG=CONFIG)
+    publish_config(config)
     
     flash("Auction rules updated", "success")
     return redirect(url_for("tournament_settings"))
 
 @app.route("/reset-config", methods=["POST"])
+@admin_only
 def reset_config():
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    
     # Reset to default config
     default_config = {
         "tournament": {"name": "Palace Premier League", "logo": "logo.png"},
@@ -1620,24 +2136,23 @@ def reset_config():
     
     save_config(default_config)
     
-    # Update global variables
-    global CONFIG, TEAMS, TEAM_BUDGET, BASE_PRICE
-    CONFIG = default_config
-    TEAMS = default_config["teams"]["names"]
-    TEAM_BUDGET = default_config["teams"]["budget"]
-    BASE_PRICE = default_config["auction"]["base_price"]
-    
-    # Update Jinja template globals
-    app.jinja_env.globals.update(CONFIG=CONFIG)
+    publish_config(default_config)
     
     flash("Settings reset to defaults", "info")
     return redirect(url_for("tournament_settings"))
 
+@app.route("/reload-config", methods=["POST"])
+@admin_only
+def reload_config():
+    """Re-read config.json after it was edited outside the app."""
+    publish_config(load_config())
+    
+    flash("Configuration reloaded from disk", "success")
+    return redirect(url_for("tournament_settings"))
+
 @app.route("/export-config")
+@admin_only
 def export_config():
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    
     config = load_config()
     
     # Generate timestamped filename
@@ -1657,15 +2172,17 @@ def export_config():
     return send_file(json_bytes, mimetype='application/json', as_attachment=True, download_name=filename)
 
 @app.route("/export-database")
+@admin_only
 def export_database():
     """Download the current database file"""
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    
     # Generate timestamped filename
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     filename = f"players_backup_{timestamp}.db"
     
+    # Fold the WAL into the main file so the download has every commit
+    with _db_lock:
+        _DB.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    
     return send_file(DB_FILE, mimetype='application/x-sqlite3', as_attachment=True, download_name=filename)
 
 # Removed player-card and team-card endpoints as per requirements
@@ -1673,59 +2190,91 @@ def export_database():
 @app.route("/live-version")
 def live_version():
     # Lightweight endpoint to let public live view detect updates without full reload
-    from flask import make_response
     resp = jsonify({
         "version": auction_version,
+        "players_version": _players_version,
         "current_player_id": int(current_auction.get("player_id") or 0)
     })
     # Prevent caching
     resp.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
     return resp
 
+def _disable_nagle(environ):
+    """Send small SSE frames immediately instead of letting Nagle hold them back."""
+    sock = environ.get("gunicorn.socket") or environ.get("werkzeug.socket")
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except (OSError, AttributeError):
+        pass  # not a TCP socket (e.g. a unix socket behind a proxy)
+
 @app.route('/events')
 def events():
     # Server-Sent Events stream for public viewers
-    q = _subscribe_sse()
+    _disable_nagle(request.environ)
+    client = _subscribe_sse()
+    # JSON frames compress well; gzip the stream when the client accepts it
+    use_gzip = 'gzip' in request.headers.get('Accept-Encoding', '')
 
     @stream_with_context
     def gen():
         heartbeat_sec = 10  # must be < any proxy/worker timeout
+        # Level 1 keeps CPU cost low; wbits=31 emits a gzip container
+        compressor = zlib.compressobj(1, zlib.DEFLATED, 31) if use_gzip else None
+
+        def encode(data):
+            if compressor is None:
+                return data
+            # Sync flush pushes each SSE record out whole instead of buffering it
+            return compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
         try:
             # Send an initial state so clients can sync immediately
-            init_msg = json.dumps({"type": "state", "version": auction_version, "payload": build_live_payload()})
-            yield f"data: {init_msg}\n\n"
+            sent_version, init_msg = state_message()
+            yield encode(init_msg)
+            last_yield = 0.0
+            burst = 0
             while True:
-                try:
-                    # Wait for broadcast, but wake up periodically to send heartbeat
-                    msg = q.get(timeout=heartbeat_sec)
-                    if isinstance(msg, str):
-                        yield f"data: {msg}\n\n"
-                    else:
-                        wrapped = json.dumps({"type": "state", "version": auction_version, "payload": build_live_payload()})
-                        yield f"data: {wrapped}\n\n"
-                except queue.Empty:
+                # Wait for broadcast, but wake up periodically to send heartbeat
+                update = client.wait(sent_version, heartbeat_sec)
+                if update is None:
                     # Heartbeat to keep connection and workers alive
                     # SSE comment line is ignored by clients but keeps the stream active
-                    yield f": keep-alive {int(time.time())}\n\n"
+                    yield encode(f": keep-alive {int(time.time())}\n\n".encode())
+                    continue
+                base_version, version, msg = update
+                if base_version is not None and base_version != sent_version:
+                    # Skipped versions while busy: the patch does not apply, resend state
+                    version, msg = state_message()
+                sent_version = version
+                yield encode(msg)
+                # Under a burst of mutations pause briefly so later ones coalesce
+                now = time.monotonic()
+                burst = burst + 1 if now - last_yield < SSE_BURST_WINDOW else 0
+                last_yield = now
+                if burst > SSE_BURST_LIMIT:
+                    time.sleep(SSE_BURST_PAUSE)
         except (GeneratorExit, BrokenPipeError, ConnectionAbortedError):
             # Client disconnected
             pass
         finally:
-            _unsubscribe_sse(q)
+            _unsubscribe_sse(client)
 
     headers = {
         'Cache-Control': 'no-cache',
         'Content-Type': 'text/event-stream',
         'X-Accel-Buffering': 'no',  # for nginx
         'Connection': 'keep-alive',
+        'Vary': 'Accept-Encoding',
     }
+    if use_gzip:
+        headers['Content-Encoding'] = 'gzip'
     return Response(gen(), headers=headers, mimetype='text/event-stream')
 
 @app.route("/import-config", methods=["POST"])
+@admin_only
 def import_config():
-    if not session.get("is_admin"):
-        return redirect(url_for("admin"))
-    
     if 'config_file' not in request.files:
         flash("No file selected", "error")
         return redirect(url_for("tournament_settings"))
@@ -1751,15 +2300,8 @@ def import_config():
             flash("Failed to save configuration", "error")
             return redirect(url_for("tournament_settings"))
         
-        # Update global variables
-        global CONFIG, TEAMS, TEAM_BUDGET, BASE_PRICE
-        CONFIG = config
-        TEAMS = config["teams"]["names"]
-        TEAM_BUDGET = config["teams"]["budget"]
-        BASE_PRICE = config["auction"]["base_price"]
-        
-        # Update Jinja template globals
-        app.jinja_env.globals.update(CONFIG=CONFIG)
+        # Swap in the new config as one snapshot
+        publish_config(config)
         
         # Log the import
         audit_logger.log_change(
@@ -1779,6 +2321,7 @@ def import_config():
 
 # Lightweight APIs for faster admin interactions (no full page reload)
 @app.route('/api/bid', methods=['POST'])
+@with_auction_lock
 def api_bid():
     if not session.get("is_admin"):
         return jsonify({"ok": False, "error": "Unauthorized"}), 401
@@ -1788,27 +2331,24 @@ def api_bid():
         team = (data.get('team') or '').strip()
         if not player_id or not team:
             return jsonify({"ok": False, "error": "Missing player_id or team"}), 400
-        df = load_players()
-        row = df[df['player_id'] == player_id]
-        if row.empty:
+        player = get_players_by_id().get(player_id)
+        if player is None:
             return jsonify({"ok": False, "error": "Player not found"}), 404
-        player = row.iloc[0].to_dict()
         # Compute next required bid
         has_leader = bool(current_auction.get('current_team'))
         next_bid = get_next_required_bid(current_auction.get('current_bid', 0), player.get('base_price', 0), has_leader)
         if next_bid is None:
             return jsonify({"ok": False, "error": "No higher increments available"}), 400
         # Validate team eligibility
-        limits = compute_team_limits(df, player, current_auction.get('current_bid', 0), current_team=current_auction.get('current_team', ''))
+        limits = compute_team_limits(get_team_aggregates(), player, current_auction.get('current_bid', 0), current_team=current_auction.get('current_team', ''))
         tl = limits.get(team)
         if not tl or not tl.get('can_bid_now'):
             return jsonify({"ok": False, "error": "Team not eligible for next bid"}), 400
         # Apply bid (append to history for undo)
-        current_auction.setdefault('history', [])
         current_auction['history'].append({
             'bid': next_bid,
             'team': team,
-            'ts': datetime.now().isoformat(),
+            'ts_ns': time.time_ns(),
         })
         current_auction['player_id'] = player_id
         current_auction['current_bid'] = next_bid
@@ -1816,30 +2356,26 @@ def api_bid():
         current_auction['status'] = 'bidding'
         # Compute next required after applying this bid
         next_required = get_next_required_bid(next_bid, player.get('base_price', 0), True)
-        broadcast_state()
+        schedule_broadcast()
         return jsonify({"ok": True, "applied_bid": next_bid, "next_required": next_required, "leader": team, "status": "bidding"})
     except Exception as e:
         return jsonify({"ok": False, "error": str(e)}), 500
 
 @app.route('/api/sold', methods=['POST'])
+@with_auction_lock
 def api_sold():
     if not session.get("is_admin"):
         return jsonify({"ok": False, "error": "Unauthorized"}), 401
     try:
         data = request.get_json(silent=True) or {}
         player_id = int(data.get('player_id') or current_auction.get('player_id') or 0)
-        print(f"DEBUG SOLD: player_id={player_id}, current_auction={current_auction}")
         if not player_id:
             return jsonify({"ok": False, "error": "No active player"}), 400
-        df = load_players()
-        idxs = df.index[df['player_id'] == player_id]
-        if len(idxs) == 0:
+        player = get_players_by_id().get(player_id)
+        if player is None:
             return jsonify({"ok": False, "error": "Player not found"}), 404
-        idx = idxs[0]
         # Get sale team - if no current team, need to determine which team to sell to
         sale_team = current_auction.get('current_team') or ''
-        # Get player info first
-        player = df.iloc[idx].to_dict()
         if not sale_team:
             # If no bids placed, we need a team to sell to - use starting team or first eligible team
             starting_team = compute_starting_team()
@@ -1850,7 +2386,7 @@ def api_sold():
                     current_auction['current_bid'] = player.get('base_price', 0)
             else:
                 return jsonify({"ok": False, "error": "No team determined for sale"}), 400
-        limits = compute_team_limits(df, player, current_auction.get('current_bid', 0), current_team=current_auction.get('current_team', ''))
+        limits = compute_team_limits(get_team_aggregates(), player, current_auction.get('current_bid', 0), current_team=current_auction.get('current_team', ''))
         tl = limits.get(sale_team)
         if not tl or current_auction.get('current_bid', 0) > tl.get('max_bid', 0):
             return jsonify({"ok": False, "error": "Team cannot complete purchase"}), 400
@@ -1859,21 +2395,18 @@ def api_sold():
         sold_price = int(current_auction.get('current_bid', 0))
         # Persist sale
         update_player_db(player_id, team=sale_team, status='sold', sold_price=sold_price, sold_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-        # Clear cache since player data changed
-        _payload_cache["df"] = None
         # Announce and keep SOLD state for viewers
         current_auction['announcement'] = f"SOLD! {player_name} to {sale_team} for ₹{format_indian_currency(sold_price)}"
         current_auction['status'] = 'sold'
         current_auction['player_sold'] = True
-        broadcast_state()
+        schedule_broadcast()
         return jsonify({"ok": True})
     except Exception as e:
-        print(f"ERROR in api_sold: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        app.logger.exception("api_sold failed")
         return jsonify({"ok": False, "error": str(e)}), 500
 
 @app.route('/api/undo', methods=['POST'])
+@with_auction_lock
 def api_undo():
     if not session.get("is_admin"):
         return jsonify({"ok": False, "error": "Unauthorized"}), 401
@@ -1881,18 +2414,17 @@ def api_undo():
         player_id = current_auction.get('player_id')
         if not player_id:
             return jsonify({"ok": False, "error": "No active player"}), 400
-        df = load_players()
-        row = df[df['player_id'] == player_id]
-        if row.empty:
+        player = get_players_by_id().get(player_id)
+        if player is None:
             return jsonify({"ok": False, "error": "Player not found"}), 404
-        base_price = int(row.iloc[0].get('base_price') or 0)
-        hist = current_auction.get('history') or []
+        base_price = int(player.get('base_price') or 0)
+        hist = current_auction['history']
         if not hist:
             # Reset to base with no leader
             current_auction['current_bid'] = base_price
             current_auction['current_team'] = ''
             current_auction['status'] = 'bidding'
-            broadcast_state()
+            schedule_broadcast()
             return jsonify({"ok": True, "current_bid": base_price, "leader": ""})
         # Pop last bid
         hist.pop()
@@ -1904,7 +2436,7 @@ def api_undo():
             current_auction['current_bid'] = base_price
             current_auction['current_team'] = ''
         current_auction['status'] = 'bidding'
-        broadcast_state()
+        schedule_broadcast()
         return jsonify({"ok": True, "current_bid": current_auction['current_bid'], "leader": current_auction['current_team']})
     except Exception as e:
         return jsonify({"ok": False, "error": str(e)}), 500
@@ -1,4 +1,4 @@
-import random
+import numpy as np
 
 # Player data with ratings
 players = {
@@ -18,16 +18,21 @@ teams = {
 
 BASE_PRICE = 0.5  # 50L in Crores
 
-def get_bid_amount(rating, team_budget, players_needed):
-    """Simulate realistic bidding based on player rating and team situation"""
-    if rating >= 90:  # Premium players
-        return min(random.uniform(3, 8), team_budget - (players_needed * BASE_PRICE))
-    elif rating >= 80:  # Good players  
-        return min(random.uniform(1.5, 4), team_budget - (players_needed * BASE_PRICE))
-    elif rating >= 65:  # Average players
-        return min(random.uniform(0.5, 2), team_budget - (players_needed * BASE_PRICE))
-    else:  # Low rated players
-        return BASE_PRICE
+# (minimum rating, low bid, high bid) in Crores; lower rated players go at BASE_PRICE
+BID_TIERS = (
+    (90, 3, 8),     # Premium players
+    (80, 1.5, 4),   # Good players
+    (65, 0.5, 2),   # Average players
+)
+
+rng = np.random.default_rng()
+
+def get_bid_amounts(rating, max_bids, players_needed):
+    """Simulate realistic bids from several teams at once based on player rating and team situation"""
+    for min_rating, low, high in BID_TIERS:
+        if rating >= min_rating:
+            return np.minimum(rng.uniform(low, high, len(max_bids)), max_bids - players_needed * BASE_PRICE)
+    return np.full(len(max_bids), BASE_PRICE)
 
 def simulate_auction():
     print("=== AUCTION SIMULATION ===\n")
@@ -35,17 +40,23 @@ def simulate_auction():
     # Set captains (highest rated players)
     captains = ["Sreehari", "Sreekanth", "Marsh"]  # Top 3 players
     team_names = list(teams.keys())
+    # Everyone placed in a squad so far, kept up to date as players are won
+    assigned = set()
     
     for i, captain in enumerate(captains):
         teams[team_names[i]]["captain"] = captain
         teams[team_names[i]]["players"].append(captain)
+        assigned.add(captain)
         print(f"{team_names[i]} Captain: {captain} ({players[captain]} rating)")
     
     # Remove captains from auction pool
     auction_players = {k: v for k, v in players.items() if k not in captains}
     
-    # Sort players by rating (auction order - highest first)
-    sorted_players = sorted(auction_players.items(), key=lambda x: x[1], reverse=True)
+    # Sort players by rating (auction order - highest first, ties in listing order)
+    names = list(auction_players)
+    ratings = np.fromiter(auction_players.values(), dtype=np.int16, count=len(names))
+    order = np.argsort(-ratings, kind="stable")
+    sorted_players = [(names[i], int(ratings[i])) for i in order]
     
     print(f"\n=== AUCTION START ===")
     print(f"Players to auction: {len(sorted_players)}")
@@ -67,20 +78,22 @@ def simulate_auction():
             print(f"❌ {player_name} - No teams can afford!")
             continue
             
-        # Simulate bidding
-        bids = []
-        for team_name, max_bid in eligible_teams:
-            # Teams more likely to bid on higher rated players
-            bid_probability = min(0.9, rating / 100 + 0.2)
-            if random.random() < bid_probability:
-                bid_amount = get_bid_amount(rating, max_bid, max(0, 8 - len(teams[team_name]["players"]) - 1))
-                if bid_amount >= BASE_PRICE and bid_amount <= max_bid:
-                    bids.append((team_name, bid_amount))
+        # Simulate bidding, drawing every team's coin flip and bid in one go
+        team_names_eligible = [team_name for team_name, _ in eligible_teams]
+        max_bids = np.array([max_bid for _, max_bid in eligible_teams])
+        players_needed = np.array([max(0, 8 - len(teams[t]["players"]) - 1) for t in team_names_eligible])
+        # Teams more likely to bid on higher rated players
+        bid_probability = min(0.9, rating / 100 + 0.2)
+        bidding = rng.random(len(eligible_teams)) < bid_probability
+        amounts = get_bid_amounts(rating, max_bids, players_needed)
+        valid = bidding & (amounts >= BASE_PRICE) & (amounts <= max_bids)
         
-        if bids:
+        if valid.any():
             # Highest bidder wins
-            winner, winning_bid = max(bids, key=lambda x: x[1])
+            best = np.flatnonzero(valid)[amounts[valid].argmax()]
+            winner, winning_bid = team_names_eligible[best], float(amounts[best])
             teams[winner]["players"].append(player_name)
+            assigned.add(player_name)
             teams[winner]["budget"] -= winning_bid
             print(f"✅ SOLD to {winner} for ₹{winning_bid:.1f}Cr")
         else:
@@ -96,7 +109,7 @@ def simulate_auction():
         print(f"  Squad: {', '.join(team_data['players'])}")
         total_players_assigned += len(team_data["players"])
     
-    unsold_players = [name for name in players.keys() if not any(name in team["players"] for team in teams.values())]
+    unsold_players = [name for name in players if name not in assigned]
     print(f"\n❌ UNSOLD PLAYERS ({len(unsold_players)}):")
     for player in unsold_players:
         print(f"  {player} (Rating: {players[player]})")
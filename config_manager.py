@@ -11,18 +11,78 @@ This module provides centralized configuration management with:
 
 import os
 import json
+import atexit
+import shutil
 import bcrypt
 import secrets
+import hashlib
+import hmac
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, NamedTuple
 import logging
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_line(obj: Any) -> bytes:
+    """Encode obj as one compact JSON line"""
+    if orjson is not None:
+        return orjson.dumps(obj) + b'\n'
+    return (json.dumps(obj) + '\n').encode('utf-8')
+
+
+def _read_json(path: str) -> Any:
+    """Parse a JSON file, with orjson when it is installed"""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def _write_json(path: str, obj: Any) -> None:
+    """Write obj as indented JSON, with orjson when it is installed"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
+
+
+class _FieldRule(NamedTuple):
+    """One CONFIG_SCHEMA entry with its optional checks pulled out"""
+    field: str
+    path: str
+    type: type
+    required: bool
+    min_length: Optional[int]
+    min: Optional[int]
+    max: Optional[int]
+    length: Optional[int]
+
+    @classmethod
+    def from_rules(cls, section: str, field: str, rules: Dict) -> "_FieldRule":
+        return cls(field, f"{section}.{field}", rules["type"], bool(rules.get("required")),
+                   rules.get("min_length"), rules.get("min"), rules.get("max"), rules.get("length"))
+
+
+class _StopValidation(Exception):
+    """Raised inside fast validation once the first error is recorded"""
+
+
 class ConfigManager:
     """Manages configuration loading, validation, and persistence"""
     
@@ -51,9 +111,19 @@ class ConfigManager:
         }
     }
     
+    # CONFIG_SCHEMA flattened once, so validation is a loop over tuples
+    _COMPILED_SCHEMA = tuple(
+        (section, tuple(_FieldRule.from_rules(section, field, rules) for field, rules in schema.items()))
+        for section, schema in CONFIG_SCHEMA.items()
+    )
+    
     def __init__(self):
         """Initialize ConfigManager and ensure backup directory exists"""
         Path(self.BACKUP_DIR).mkdir(exist_ok=True)
+        # Raw bytes of the last config that passed validation, keyed on the
+        # file's (mtime_ns, size)
+        self._cache_key = None
+        self._cache_bytes = None
     
     def load_config(self) -> Dict:
         """Load and validate configuration from config.json"""
@@ -62,16 +132,24 @@ class ConfigManager:
                 logger.warning(f"{self.CONFIG_FILE} not found, creating default configuration")
                 return self._get_default_config()
             
-            with open(self.CONFIG_FILE, 'r') as f:
-                config = json.load(f)
+            st = os.stat(self.CONFIG_FILE)
+            key = (st.st_mtime_ns, st.st_size)
+            if key == self._cache_key:
+                # Unchanged and already validated; parse again so each caller gets its own dict
+                return _json_loads(self._cache_bytes)
+            
+            with open(self.CONFIG_FILE, 'rb') as f:
+                data = f.read()
+            config = _json_loads(data)
             
             # Validate configuration
-            is_valid, errors = self.validate_config(config)
+            is_valid, errors = self.validate_config(config, fast=True)
             if not is_valid:
                 logger.error(f"Configuration validation failed: {errors}")
                 logger.warning("Using default configuration")
                 return self._get_default_config()
             
+            self._cache_key, self._cache_bytes = key, data
             return config
             
         except json.JSONDecodeError as e:
@@ -86,7 +164,7 @@ class ConfigManager:
         """Save configuration with validation and backup"""
         try:
             # Validate before saving
-            is_valid, errors = self.validate_config(config)
+            is_valid, errors = self.validate_config(config, fast=True)
             if not is_valid:
                 logger.error(f"Cannot save invalid configuration: {errors}")
                 return False
@@ -96,8 +174,8 @@ class ConfigManager:
                 self.create_backup()
             
             # Save configuration
-            with open(self.CONFIG_FILE, 'w') as f:
-                json.dump(config, f, indent=2)
+            self._cache_key = None
+            _write_json(self.CONFIG_FILE, config)
             
             logger.info("Configuration saved successfully")
             return True
@@ -106,79 +184,94 @@ class ConfigManager:
             logger.error(f"Error saving configuration: {e}")
             return False
     
-    def validate_config(self, config: Dict) -> Tuple[bool, List[str]]:
-        """Validate configuration structure and values"""
+    def validate_config(self, config: Dict, fast: bool = False) -> Tuple[bool, List[str]]:
+        """Validate configuration structure and values
+        
+        With fast=True validation stops at the first error, for callers that
+        only need to know whether the config is usable.
+        """
         errors = []
         
         if not isinstance(config, dict):
             return False, ["Configuration must be a JSON object"]
         
+        if fast:
+            def add_error(message: str) -> None:
+                errors.append(message)
+                raise _StopValidation
+        else:
+            add_error = errors.append
+        
+        try:
+            self._check_config(config, add_error)
+        except _StopValidation:
+            pass
+        return len(errors) == 0, errors
+    
+    def _check_config(self, config: Dict, add_error) -> None:
+        """Report every schema and cross-field problem in config via add_error"""
         # Validate each section
-        for section, schema in self.CONFIG_SCHEMA.items():
+        for section, rules in self._COMPILED_SCHEMA:
             if section not in config:
-                errors.append(f"Missing required section: {section}")
+                add_error(f"Missing required section: {section}")
                 continue
             
             section_data = config[section]
             if not isinstance(section_data, dict):
-                errors.append(f"Section '{section}' must be an object")
+                add_error(f"Section '{section}' must be an object")
                 continue
             
             # Validate fields in section
-            for field, rules in schema.items():
-                field_path = f"{section}.{field}"
-                
-                # Check if required field exists
-                if rules.get("required") and field not in section_data:
-                    errors.append(f"Missing required field: {field_path}")
-                    continue
-                
-                if field not in section_data:
+            for rule in rules:
+                if rule.field not in section_data:
+                    # Check if required field exists
+                    if rule.required:
+                        add_error(f"Missing required field: {rule.path}")
                     continue
                 
-                value = section_data[field]
-                expected_type = rules["type"]
+                value = section_data[rule.field]
+                expected_type = rule.type
                 
                 # Type validation
                 if not isinstance(value, expected_type):
-                    errors.append(
-                        f"Field '{field_path}' must be type {expected_type.__name__}, "
+                    add_error(
+                        f"Field '{rule.path}' must be type {expected_type.__name__}, "
                         f"got {type(value).__name__}"
                     )
                     continue
                 
                 # String length validation
-                if expected_type == str and "min_length" in rules:
-                    if len(value) < rules["min_length"]:
-                        errors.append(
-                            f"Field '{field_path}' must have at least "
-                            f"{rules['min_length']} characters"
+                if expected_type is str:
+                    if rule.min_length is not None and len(value) < rule.min_length:
+                        add_error(
+                            f"Field '{rule.path}' must have at least "
+                            f"{rule.min_length} characters"
                         )
                 
                 # Numeric range validation
-                if expected_type == int:
-                    if "min" in rules and value < rules["min"]:
-                        errors.append(
-                            f"Field '{field_path}' must be at least {rules['min']}, "
+                elif expected_type is int:
+                    if rule.min is not None and value < rule.min:
+                        add_error(
+                            f"Field '{rule.path}' must be at least {rule.min}, "
                             f"got {value}"
                         )
-                    if "max" in rules and value > rules["max"]:
-                        errors.append(
-                            f"Field '{field_path}' must be at most {rules['max']}, "
+                    if rule.max is not None and value > rule.max:
+                        add_error(
+                            f"Field '{rule.path}' must be at most {rule.max}, "
                             f"got {value}"
                         )
                 
                 # List length validation
-                if expected_type == list:
-                    if "min_length" in rules and len(value) < rules["min_length"]:
-                        errors.append(
-                            f"Field '{field_path}' must have at least "
-                            f"{rules['min_length']} items"
+                elif expected_type is list:
+                    if rule.min_length is not None and len(value) < rule.min_length:
+                        add_error(
+                            f"Field '{rule.path}' must have at least "
+                            f"{rule.min_length} items"
                         )
-                    if "length" in rules and len(value) != rules["length"]:
-                        errors.append(
-                            f"Field '{field_path}' must have exactly "
-                            f"{rules['length']} items, got {len(value)}"
+                    if rule.length is not None and len(value) != rule.length:
+                        add_error(
+                            f"Field '{rule.path}' must have exactly "
+                            f"{rule.length} items, got {len(value)}"
                         )
         
         # Additional validation: teams.count should match teams.names length
@@ -186,7 +279,7 @@ class ConfigManager:
             teams = config["teams"]
             if "count" in teams and "names" in teams:
                 if isinstance(teams["names"], list) and teams["count"] != len(teams["names"]):
-                    errors.append(
+                    add_error(
                         f"teams.count ({teams['count']}) must match number of team names "
                         f"({len(teams['names'])})"
                     )
@@ -194,7 +287,7 @@ class ConfigManager:
             # Validate min_players <= max_players
             if "min_players" in teams and "max_players" in teams:
                 if teams["min_players"] > teams["max_players"]:
-                    errors.append(
+                    add_error(
                         f"teams.min_players ({teams['min_players']}) cannot be greater than "
                         f"teams.max_players ({teams['max_players']})"
                     )
@@ -205,11 +298,9 @@ class ConfigManager:
             if isinstance(increments, list):
                 for i, inc in enumerate(increments):
                     if not isinstance(inc, int) or inc <= 0:
-                        errors.append(
+                        add_error(
                             f"auction.increments[{i}] must be a positive integer, got {inc}"
                         )
-        
-        return len(errors) == 0, errors
     
     def create_backup(self) -> Optional[str]:
         """Create timestamped backup of current configuration"""
@@ -223,11 +314,8 @@ class ConfigManager:
             backup_filename = f"config_backup_{timestamp}.json"
             backup_path = os.path.join(self.BACKUP_DIR, backup_filename)
             
-            # Copy current config to backup
-            with open(self.CONFIG_FILE, 'r') as src:
-                config = json.load(src)
-            with open(backup_path, 'w') as dst:
-                json.dump(config, dst, indent=2)
+            # Copy current config to backup byte for byte
+            shutil.copyfile(self.CONFIG_FILE, backup_path)
             
             logger.info(f"Backup created: {backup_path}")
             
@@ -243,17 +331,16 @@ class ConfigManager:
     def _cleanup_old_backups(self):
         """Maintain only the last MAX_BACKUPS backups"""
         try:
-            backup_files = []
-            for filename in os.listdir(self.BACKUP_DIR):
-                if filename.startswith("config_backup_") and filename.endswith(".json"):
-                    filepath = os.path.join(self.BACKUP_DIR, filename)
-                    backup_files.append((filepath, os.path.getmtime(filepath)))
-            
-            # Sort by modification time (newest first)
-            backup_files.sort(key=lambda x: x[1], reverse=True)
+            # Names embed a YYYY-MM-DD_HH-MM-SS stamp, so name order is age order (newest first)
+            with os.scandir(self.BACKUP_DIR) as entries:
+                backup_files = sorted(
+                    ((entry.name, entry.path) for entry in entries
+                     if entry.name.startswith("config_backup_") and entry.name.endswith(".json")),
+                    reverse=True,
+                )
             
             # Delete old backups beyond MAX_BACKUPS
-            for filepath, _ in backup_files[self.MAX_BACKUPS:]:
+            for _, filepath in backup_files[self.MAX_BACKUPS:]:
                 os.remove(filepath)
                 logger.info(f"Deleted old backup: {filepath}")
                 
@@ -264,13 +351,15 @@ class ConfigManager:
         """List available configuration backups"""
         try:
             backups = []
-            for filename in os.listdir(self.BACKUP_DIR):
-                if filename.startswith("config_backup_") and filename.endswith(".json"):
-                    filepath = os.path.join(self.BACKUP_DIR, filename)
-                    stat = os.stat(filepath)
+            with os.scandir(self.BACKUP_DIR) as entries:
+                for entry in entries:
+                    filename = entry.name
+                    if not (filename.startswith("config_backup_") and filename.endswith(".json")):
+                        continue
+                    stat = entry.stat()
                     backups.append({
                         "filename": filename,
-                        "path": filepath,
+                        "path": entry.path,
                         "timestamp": datetime.fromtimestamp(stat.st_mtime).isoformat(),
                         "size": stat.st_size
                     })
@@ -293,10 +382,9 @@ class ConfigManager:
                 return False
             
             # Load and validate backup
-            with open(backup_path, 'r') as f:
-                config = json.load(f)
+            config = _read_json(backup_path)
             
-            is_valid, errors = self.validate_config(config)
+            is_valid, errors = self.validate_config(config, fast=True)
             if not is_valid:
                 logger.error(f"Backup configuration is invalid: {errors}")
                 return False
@@ -306,8 +394,8 @@ class ConfigManager:
                 self.create_backup()
             
             # Restore backup
-            with open(self.CONFIG_FILE, 'w') as f:
-                json.dump(config, f, indent=2)
+            self._cache_key = None
+            _write_json(self.CONFIG_FILE, config)
             
             logger.info(f"Configuration restored from: {backup_filename}")
             return True
@@ -338,10 +426,28 @@ class ConfigManager:
         }
 
 
+@lru_cache(maxsize=None)
+def _load_env_once() -> None:
+    """Read .env into the process environment on first use only"""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
 class PasswordManager:
     """Manages password hashing and verification using bcrypt"""
     
     BCRYPT_ROUNDS = 12  # Work factor for bcrypt
+    # Successful verifications are remembered briefly so repeated admin
+    # logins do not pay the bcrypt cost each time
+    VERIFY_CACHE_TTL = 300  # seconds
+    VERIFY_CACHE_SIZE = 128
+    
+    def __init__(self):
+        """Set up the short-lived cache of successful verifications"""
+        # Entries are keyed on an HMAC under a per-process key, never the raw password
+        self._verify_key = secrets.token_bytes(32)
+        self._verified = OrderedDict()  # (password mac, hash) -> expiry
+        self._verified_lock = threading.Lock()
     
     def hash_password(self, password: str) -> str:
         """Hash password using bcrypt with 12 rounds"""
@@ -360,15 +466,29 @@ class PasswordManager:
             if isinstance(hashed, str):
                 hashed = hashed.encode('utf-8')
             
-            return bcrypt.checkpw(password, hashed)
+            key = (hmac.new(self._verify_key, password, hashlib.sha256).digest(), hashed)
+            now = time.monotonic()
+            with self._verified_lock:
+                expiry = self._verified.get(key)
+                if expiry is not None and expiry > now:
+                    return True
+            
+            if not bcrypt.checkpw(password, hashed):
+                return False
+            
+            with self._verified_lock:
+                self._verified[key] = now + self.VERIFY_CACHE_TTL
+                self._verified.move_to_end(key)
+                while len(self._verified) > self.VERIFY_CACHE_SIZE:
+                    self._verified.popitem(last=False)
+            return True
         except Exception as e:
             logger.error(f"Error verifying password: {e}")
             return False
     
     def get_admin_password_hash(self) -> str:
         """Get admin password hash from environment or generate default"""
-        from dotenv import load_dotenv
-        load_dotenv()
+        _load_env_once()
         
         password_hash = os.getenv('ADMIN_PASSWORD_HASH')
         
@@ -391,8 +511,7 @@ class EnvironmentManager:
     
     def __init__(self):
         """Initialize and load environment variables"""
-        from dotenv import load_dotenv
-        load_dotenv()
+        _load_env_once()
     
     def get_secret_key(self) -> str:
         """Get Flask secret key from environment or generate random"""
@@ -409,6 +528,8 @@ class EnvironmentManager:
             "Sessions will be invalidated on restart. "
             "Please set FLASK_SECRET_KEY in .env file for production!"
         )
+        # Keep it for later calls so the key stays the same for the whole process
+        os.environ['FLASK_SECRET_KEY'] = generated_key
         
         return generated_key
     
@@ -433,6 +554,33 @@ class AuditLogger:
     
     AUDIT_LOG_FILE = "audit.log"
     MAX_LOG_ENTRIES = 50
+    FLUSH_ENTRIES = 64  # write out once this many entries are buffered
+    FLUSH_INTERVAL = 0.5  # seconds a buffered entry may wait before being written
+    TAIL_BLOCK_SIZE = 8192  # bytes read per step when scanning the log backwards
+    
+    def __init__(self):
+        """Set up the in-memory write buffer, drained on exit"""
+        self._buf: List[bytes] = []
+        self._buf_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        atexit.register(self.flush)
+    
+    def flush(self) -> None:
+        """Append all buffered entries to the log with a single write"""
+        with self._buf_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._buf:
+                return
+            try:
+                with open(self.AUDIT_LOG_FILE, 'ab') as f:
+                    f.write(b"".join(self._buf))
+            except OSError as e:
+                # Keep the entries buffered so the next flush retries them
+                logger.error(f"Error writing audit log ({len(self._buf)} entries pending): {e}")
+                return
+            self._buf = []
     
     def log_change(self, field: str, old_value: Any, new_value: Any, 
                    session_id: str = "unknown") -> None:
@@ -448,9 +596,16 @@ class AuditLogger:
                 "action": "update"
             }
             
-            # Append to log file
-            with open(self.AUDIT_LOG_FILE, 'a') as f:
-                f.write(json.dumps(log_entry) + '\n')
+            # Buffer the entry; flush() appends the batch to the log file
+            with self._buf_lock:
+                self._buf.append(_json_line(log_entry))
+                flush_now = len(self._buf) >= self.FLUSH_ENTRIES
+                if not flush_now and self._flush_timer is None:
+                    self._flush_timer = threading.Timer(self.FLUSH_INTERVAL, self.flush)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+            if flush_now:
+                self.flush()
             
             logger.info(f"Audit log: {field} changed by {session_id}")
             
@@ -462,21 +617,33 @@ class AuditLogger:
     def get_recent_changes(self, limit: int = 50) -> List[Dict]:
         """Get recent configuration changes"""
         try:
+            self.flush()
             if not os.path.exists(self.AUDIT_LOG_FILE):
                 return []
             
+            # Read backwards from the end until enough lines are in hand
+            with open(self.AUDIT_LOG_FILE, 'rb') as f:
+                pos = f.seek(0, os.SEEK_END)
+                data = b""
+                while pos > 0 and data.count(b"\n") <= limit + 1:
+                    step = min(self.TAIL_BLOCK_SIZE, pos)
+                    pos -= step
+                    f.seek(pos)
+                    data = f.read(step) + data
+            lines = data.splitlines()
+            if pos > 0:
+                lines = lines[1:]  # first line may be cut off mid-entry
+            
+            # Most recent entries first; only parse as many lines as needed
             changes = []
-            with open(self.AUDIT_LOG_FILE, 'r') as f:
-                for line in f:
-                    try:
-                        entry = json.loads(line.strip())
-                        changes.append(entry)
-                    except json.JSONDecodeError:
-                        continue
-            
-            # Return most recent entries (reverse chronological order)
-            changes.reverse()
-            return changes[:limit]
+            for line in reversed(lines):
+                if len(changes) >= limit:
+                    break
+                try:
+                    changes.append(_json_loads(line))
+                except json.JSONDecodeError:
+                    continue
+            return changes
             
         except Exception as e:
             logger.error(f"Error reading audit log: {e}")
@@ -2,29 +2,91 @@
 """
 Script to link player photos to database records
 """
+import bisect
 import sqlite3
 import os
-import re
+from functools import lru_cache
 
 DB_FILE = "players.db"
 PHOTOS_DIR = "static/players"
+PHOTO_EXTENSIONS = frozenset({'jpg', 'jpeg', 'png', 'gif'})
+
+# ASCII bytes that are not [a-z0-9]; anything non-ASCII is dropped by the encode
+_NON_ALNUM = bytes(c for c in range(128) if not (chr(c).isdigit() or 'a' <= chr(c) <= 'z'))
 
 def normalize_name(name):
     """Normalize name for matching (lowercase, remove spaces/special chars)"""
-    return re.sub(r'[^a-z0-9]', '', name.lower())
+    return name.lower().encode('ascii', 'ignore').translate(None, _NON_ALNUM).decode('ascii')
 
-def list_players_and_photos():
-    """List all players and available photos"""
-    conn = sqlite3.connect(DB_FILE)
+def _is_photo_name(filename):
+    """True if the file extension (case-insensitive) is one of PHOTO_EXTENSIONS"""
+    _, dot, ext = filename.rpartition('.')
+    return bool(dot) and ext.lower() in PHOTO_EXTENSIONS
+
+@lru_cache(maxsize=None)
+def get_connection():
+    """Shared connection to the players database (WAL mode, as the app uses),
+    kept open so its page cache survives between commands"""
+    conn = sqlite3.connect(DB_FILE, isolation_level=None, check_same_thread=False)
+    conn.executescript(
+        "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA busy_timeout=5000; "
+        "PRAGMA mmap_size=268435456; PRAGMA cache_size=-65536;"
+    )
+    return conn
+
+def build_partial_matcher(photo_map):
+    """Return a function finding the first photo whose key contains, or is
+    contained in, a normalized name - without scanning every key per name"""
+    keys = list(photo_map)
+    key_index = {}
+    for i, key in enumerate(keys):
+        key_index.setdefault(key, i)
+    # All keys in one string, so "name in key" is a single C-level find
+    haystack = "\0".join(keys)
+    starts = []
+    offset = 0
+    for key in keys:
+        starts.append(offset)
+        offset += len(key) + 1
+    lengths = {len(key) for key in keys}
+
+    def match(normalized_name):
+        if not keys:
+            return None
+        best = len(keys)
+        pos = haystack.find(normalized_name)
+        if pos != -1:
+            best = bisect.bisect_right(starts, pos) - 1
+        # "key in name": look up each substring of the name of a length some key has
+        n = len(normalized_name)
+        for length in lengths:
+            for start in range(n - length + 1):
+                i = key_index.get(normalized_name[start:start + length])
+                if i is not None and i < best:
+                    best = i
+        return photo_map[keys[best]] if best < len(keys) else None
+
+    return match
+
+@lru_cache(maxsize=1)
+def _load_state():
+    """Players and available photo files, read once per session until a link changes them"""
+    conn = get_connection()
     cursor = conn.cursor()
     cursor.execute("SELECT player_id, name, photo FROM players ORDER BY player_id")
-    players = cursor.fetchall()
-    conn.close()
+    players = tuple(cursor.fetchall())
     
     # Get available photos
-    photos = []
+    photos = ()
     if os.path.exists(PHOTOS_DIR):
-        photos = [f for f in os.listdir(PHOTOS_DIR) if f.lower().endswith(('.jpg', '.jpeg', '.png', '.gif'))]
+        with os.scandir(PHOTOS_DIR) as entries:
+            photos = tuple(e.name for e in entries
+                           if _is_photo_name(e.name) and e.is_file())
+    return players, photos
+
+def list_players_and_photos():
+    """List all players and available photos"""
+    players, photos = _load_state()
     
     print("\n=== Current Players ===")
     print(f"{'ID':<5} {'Name':<30} {'Current Photo':<30}")
@@ -39,15 +101,7 @@ def list_players_and_photos():
 
 def auto_link_photos():
     """Automatically link photos based on name matching"""
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute("SELECT player_id, name, photo FROM players ORDER BY player_id")
-    players = cursor.fetchall()
-    
-    # Get available photos
-    photos = []
-    if os.path.exists(PHOTOS_DIR):
-        photos = [f for f in os.listdir(PHOTOS_DIR) if f.lower().endswith(('.jpg', '.jpeg', '.png', '.gif'))]
+    players, photos = _load_state()
     
     # Create mapping of normalized names to photo files
     photo_map = {}
@@ -57,6 +111,7 @@ def auto_link_photos():
         normalized = normalize_name(name_part)
         photo_map[normalized] = photo
     
+    partial_match = build_partial_matcher(photo_map)
     updates = []
     matched = 0
     unmatched = []
@@ -72,23 +127,21 @@ def auto_link_photos():
             print(f"✓ Matched: {name} → {photo_file}")
         else:
             # Try partial match
-            found = False
-            for photo_key, photo_file in photo_map.items():
-                if photo_key in normalized_name or normalized_name in photo_key:
-                    updates.append((photo_file, player_id))
-                    matched += 1
-                    print(f"~ Partial match: {name} → {photo_file}")
-                    found = True
-                    break
-            
-            if not found:
+            photo_file = partial_match(normalized_name)
+            if photo_file is not None:
+                updates.append((photo_file, player_id))
+                matched += 1
+                print(f"~ Partial match: {name} → {photo_file}")
+            else:
                 unmatched.append((player_id, name))
     
     if updates:
         print(f"\n=== Updating {len(updates)} player photos ===")
-        for photo, player_id in updates:
-            cursor.execute("UPDATE players SET photo = ? WHERE player_id = ?", (photo, player_id))
-        conn.commit()
+        conn = get_connection()
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany("UPDATE players SET photo = ? WHERE player_id = ?", updates)
+        conn.execute("COMMIT")
+        _load_state.cache_clear()
         print(f"✓ Successfully updated {len(updates)} player photos!")
     
     if unmatched:
@@ -96,12 +149,11 @@ def auto_link_photos():
         for player_id, name in unmatched:
             print(f"  #{player_id}: {name}")
     
-    conn.close()
     return matched, len(unmatched)
 
 def manual_link_photo(player_id, photo_filename):
     """Manually link a photo to a player"""
-    conn = sqlite3.connect(DB_FILE)
+    conn = get_connection()
     cursor = conn.cursor()
     
     # Check if player exists
@@ -110,15 +162,13 @@ def manual_link_photo(player_id, photo_filename):
     
     if not result:
         print(f"Error: Player with ID {player_id} not found!")
-        conn.close()
         return False
     
     name = result[0]
     
     # Update the photo
     cursor.execute("UPDATE players SET photo = ? WHERE player_id = ?", (photo_filename, player_id))
-    conn.commit()
-    conn.close()
+    _load_state.cache_clear()
     
     print(f"✓ Linked {photo_filename} to player #{player_id} ({name})")
     return True
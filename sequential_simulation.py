@@ -1,4 +1,9 @@
+import os
 import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 
 # Player data with ratings
 players = {
@@ -9,105 +14,127 @@ players = {
     "Ramkumar": 50, "Abhilash": 85, "Vysakh": 75, "Vedu": 75, "Ram Manohar": 90, "Kiran": 90
 }
 
-# Team setup
+# Team setup (each simulation run works on its own copy)
 teams = {
-    "Palace Tuskers": {"budget": 25, "players": [], "captain": None},
-    "Palace Titans": {"budget": 25, "players": [], "captain": None}, 
-    "Palace Warriors": {"budget": 25, "players": [], "captain": None}
+    "Palace Tuskers": {"budget": 25, "players": [], "captain": None, "low_count": 0, "size": 0},
+    "Palace Titans": {"budget": 25, "players": [], "captain": None, "low_count": 0, "size": 0}, 
+    "Palace Warriors": {"budget": 25, "players": [], "captain": None, "low_count": 0, "size": 0}
 }
 
 BASE_PRICE = 0.5  # 50L in Crores
+SHOW_BID_LIMITS = True  # Print each team's max-bid calculation every round
+
+# Budget a team must hold back to reach 8 players at base price, by current squad size (max 9)
+RESERVE = tuple(max(0, 8 - size) * BASE_PRICE for size in range(10))
+
+# Players as parallel tuples; the simulation refers to players by index
+NAMES = tuple(players)
+RATINGS = tuple(players.values())
+IDX = {name: i for i, name in enumerate(NAMES)}
+
+# Players rated below 65, which teams are reluctant to stack up
+LOW_RATED = frozenset(i for i, rating in enumerate(RATINGS) if rating < 65)
+
+# Captains, in team order; everyone else goes to auction
+CAPTAINS = ("Arjun", "Marsh", "Ram Manohar")
+_CAPTAIN_SET = frozenset(CAPTAINS)
+AUCTION_ITEMS = tuple((name, rating) for name, rating in players.items() if name not in _CAPTAIN_SET)
 
 def create_strategic_sequence():
     """Create auction sequence mixing high and low rated players throughout"""
-    # Remove captains
-    captains = ["Arjun", "Marsh", "Ram Manohar"]
-    auction_players = {k: v for k, v in players.items() if k not in captains}
+    # Captains are already left out of AUCTION_ITEMS
+    names = np.array([name for name, _ in AUCTION_ITEMS])
+    ratings = np.fromiter((rating for _, rating in AUCTION_ITEMS), dtype=np.int16, count=len(AUCTION_ITEMS))
     
-    # Categorize players
-    premium = [(k, v) for k, v in auction_players.items() if v >= 90]  # 90+
-    good = [(k, v) for k, v in auction_players.items() if 80 <= v < 90]  # 80-89
-    average = [(k, v) for k, v in auction_players.items() if 65 <= v < 80]  # 65-79
-    low = [(k, v) for k, v in auction_players.items() if v < 65]  # <65
+    # Categorize players: 0 = low (<65), 1 = average (65-79), 2 = good (80-89), 3 = premium (90+)
+    category = np.digitize(ratings, [65, 80, 90])
     
-    # Strategic sequence: Interleave categories so low players come between good ones
-    sequence = []
+    # Position of each player within its own category, in original order
+    rank = np.empty_like(category)
+    for c in range(4):
+        mask = category == c
+        rank[mask] = np.arange(mask.sum())
     
+    # Strategic sequence: Interleave categories so low players come between good ones
     # Pattern: Premium -> Low -> Good -> Average -> Premium -> Low -> etc.
-    all_lists = [premium, good, average, low]
-    max_len = max(len(lst) for lst in all_lists)
-    
-    # Interleave players from different categories
-    for i in range(max_len):
-        # Add premium player if available
-        if i < len(premium):
-            sequence.append(premium[i])
-        
-        # Add low player early (when teams have budget)
-        if i < len(low):
-            sequence.append(low[i])
-            
-        # Add good player
-        if i < len(good):
-            sequence.append(good[i])
-            
-        # Add average player
-        if i < len(average):
-            sequence.append(average[i])
-    
-    return [name for name, rating in sequence]
+    slot_order = np.array([1, 3, 2, 0])[category]  # low, average, good, premium
+    order = np.lexsort((slot_order, rank))
+    return names[order].tolist()
+
+def _fresh_teams():
+    """Copy of the starting team setup for one simulation run"""
+    return {name: dict(data, players=list(data["players"])) for name, data in teams.items()}
 
-def simulate_sequential_auction():
-    print("=== SEQUENTIAL AUCTION SIMULATION ===\n")
+def simulate_sequential_auction(seed=None, verbose=True):
+    # Own generator so runs are reproducible and independent of other users of random
+    rnd = random.Random(seed).random
+    teams = _fresh_teams()
+    show_limits = verbose and SHOW_BID_LIMITS
     
-    # Set captains
-    captains = ["Arjun", "Marsh", "Ram Manohar"]
-    team_names = list(teams.keys())
+    # Output is collected and written once per round rather than line by line
+    log = []
+    out = log.append if verbose else (lambda line: None)
+    
+    def flush_log():
+        if log:
+            sys.stdout.write("\n".join(log) + "\n")
+            log.clear()
+    
+    out("=== SEQUENTIAL AUCTION SIMULATION ===\n")
     
-    for i, captain in enumerate(captains):
-        teams[team_names[i]]["captain"] = captain
-        teams[team_names[i]]["players"].append(captain)
-        print(f"{team_names[i]} Captain: {captain} ({players[captain]} rating)")
+    # Set captains
+    for team_name, captain in zip(teams, CAPTAINS):
+        team_data = teams[team_name]
+        team_data["captain"] = captain
+        captain_id = IDX[captain]
+        team_data["players"].append(captain_id)
+        team_data["size"] += 1
+        if captain_id in LOW_RATED:
+            team_data["low_count"] += 1
+        out(f"{team_name} Captain: {captain} ({RATINGS[captain_id]} rating)")
     
     # Create strategic sequence
-    auction_sequence = create_strategic_sequence()
+    auction_sequence = [IDX[name] for name in create_strategic_sequence()]
     
-    print(f"\n=== AUCTION SEQUENCE ===")
-    for i, player in enumerate(auction_sequence, 1):
-        print(f"{i:2d}. {player} (Rating: {players[player]})")
+    out(f"\n=== AUCTION SEQUENCE ===")
+    for i, player_id in enumerate(auction_sequence, 1):
+        out(f"{i:2d}. {NAMES[player_id]} (Rating: {RATINGS[player_id]})")
     
-    print(f"\n=== AUCTION START ===")
+    out(f"\n=== AUCTION START ===")
     
-    for round_num, player_name in enumerate(auction_sequence, 1):
-        rating = players[player_name]
-        print(f"\n--- Round {round_num}: {player_name} (Rating: {rating}) ---")
+    for round_num, player_id in enumerate(auction_sequence, 1):
+        flush_log()
+        player_name = NAMES[player_id]
+        rating = RATINGS[player_id]
+        out(f"\n--- Round {round_num}: {player_name} (Rating: {rating}) ---")
         
         # Check which teams can bid and need players
         eligible_teams = []
         for team_name, team_data in teams.items():
-            current_players = len(team_data["players"])
-            if current_players < 9:  # Max 9 players per team
-                players_needed_after = max(0, 8 - current_players)  # Still need to reach 8 total
-                max_bid = team_data["budget"] - (players_needed_after * BASE_PRICE)
-                
-                # Test our formula
-                print(f"    {team_name}: {current_players} players, ₹{team_data['budget']:.1f}Cr left, need {players_needed_after} more → Max bid: ₹{max_bid:.1f}Cr")
-                
-                if max_bid >= BASE_PRICE:
-                    eligible_teams.append((team_name, max_bid, current_players))
-                else:
-                    print(f"    {team_name}: Cannot bid (max_bid ₹{max_bid:.1f}Cr < base ₹{BASE_PRICE}Cr)")
+            current_players = team_data["size"]
+            if current_players >= 9:  # Max 9 players per team
+                continue
+            max_bid = team_data["budget"] - RESERVE[current_players]
+            
+            # Test our formula
+            if show_limits:
+                out(f"    {team_name}: {current_players} players, ₹{team_data['budget']:.1f}Cr left, need {max(0, 8 - current_players)} more → Max bid: ₹{max_bid:.1f}Cr")
+            
+            if max_bid < BASE_PRICE:
+                if show_limits:
+                    out(f"    {team_name}: Cannot bid (max_bid ₹{max_bid:.1f}Cr < base ₹{BASE_PRICE}Cr)")
+                continue
+            eligible_teams.append((team_name, max_bid, current_players))
         
         if not eligible_teams:
-            print(f"❌ {player_name} - No teams can afford!")
+            out(f"❌ {player_name} - No teams can afford!")
             continue
         
         # Simulate bidding behavior based on player rating and team needs
         bids = []
         for team_name, max_bid, current_players in eligible_teams:
             # Check how many low-rated players this team already has
-            team_low_players = sum(1 for p in teams[team_name]["players"] 
-                                 if p in players and players[p] < 65)
+            team_low_players = teams[team_name]["low_count"]
             
             # Bidding probability based on rating and team situation
             base_probability = min(0.9, rating / 100 + 0.1)
@@ -124,7 +151,7 @@ def simulate_sequential_auction():
                 base_probability *= 0.5
             
             # In sequential auction, teams MUST bid - but can be reluctant
-            will_bid = random.random() < base_probability
+            will_bid = rnd() < base_probability
             
             # Force bid if budget is very high (can't be too selective)
             if max_bid > 15 and rating >= 60:
@@ -133,72 +160,104 @@ def simulate_sequential_auction():
             if will_bid:
                 # Bid amount based on rating
                 if rating >= 90:
-                    bid_amount = min(random.uniform(3, 7), max_bid)
+                    bid_amount = min(3.0 + 4.0 * rnd(), max_bid)
                 elif rating >= 80:
-                    bid_amount = min(random.uniform(1.5, 4), max_bid)
+                    bid_amount = min(1.5 + 2.5 * rnd(), max_bid)
                 elif rating >= 65:
-                    bid_amount = min(random.uniform(0.5, 2), max_bid)
+                    bid_amount = min(0.5 + 1.5 * rnd(), max_bid)
                 else:
                     bid_amount = BASE_PRICE  # Only base price for low rated
                 
-                # Ensure bid respects our max bid formula
-                if bid_amount >= BASE_PRICE and bid_amount <= max_bid:
-                    bids.append((team_name, bid_amount))
-                elif bid_amount > max_bid:
-                    # Formula prevents overbidding
-                    print(f"    {team_name}: Wanted to bid ₹{bid_amount:.1f}Cr but max allowed is ₹{max_bid:.1f}Cr")
-                    bids.append((team_name, max_bid))  # Bid maximum allowed
+                # Capped at max_bid above, and eligible teams have max_bid >= BASE_PRICE
+                assert BASE_PRICE <= bid_amount <= max_bid
+                bids.append((team_name, bid_amount))
         
         if bids:
-            # Highest bidder wins
-            winner, winning_bid = max(bids, key=lambda x: x[1])
-            teams[winner]["players"].append(player_name)
+            # Highest bidder wins (first one on a tie)
+            winner, winning_bid = None, -1
+            for team_name, bid_amount in bids:
+                if bid_amount > winning_bid:
+                    winner, winning_bid = team_name, bid_amount
+            teams[winner]["players"].append(player_id)
+            teams[winner]["size"] += 1
+            if player_id in LOW_RATED:
+                teams[winner]["low_count"] += 1
             teams[winner]["budget"] -= winning_bid
-            print(f"✅ SOLD to {winner} for ₹{winning_bid:.1f}Cr")
+            out(f"✅ SOLD to {winner} for ₹{winning_bid:.1f}Cr")
         else:
             # No bids - force assignment to team with highest budget (realistic auction)
             if eligible_teams:
-                winner_team = max(eligible_teams, key=lambda x: x[1])[0]
-                teams[winner_team]["players"].append(player_name)
+                winner_team, best_max_bid = None, -1
+                for team_name, max_bid, _ in eligible_teams:
+                    if max_bid > best_max_bid:
+                        winner_team, best_max_bid = team_name, max_bid
+                teams[winner_team]["players"].append(player_id)
+                teams[winner_team]["size"] += 1
+                if player_id in LOW_RATED:
+                    teams[winner_team]["low_count"] += 1
                 teams[winner_team]["budget"] -= BASE_PRICE
-                print(f"✅ FORCED SALE to {winner_team} for ₹{BASE_PRICE}Cr (no bids - highest budget)")
+                out(f"✅ FORCED SALE to {winner_team} for ₹{BASE_PRICE}Cr (no bids - highest budget)")
             else:
-                print(f"❌ {player_name} - NO ELIGIBLE TEAMS!")
+                out(f"❌ {player_name} - NO ELIGIBLE TEAMS!")
     
     # Show final results
-    print(f"\n=== FINAL RESULTS ===")
+    out(f"\n=== FINAL RESULTS ===")
+    # One pass over the teams collects everything the summary below needs
     total_assigned = 0
+    all_assigned = set()
+    distribution = []
+    budgets = []
     for team_name, team_data in teams.items():
-        print(f"\n{team_name}:")
-        print(f"  Players: {len(team_data['players'])}")
-        print(f"  Budget left: ₹{team_data['budget']:.1f}Cr")
-        print(f"  Squad: {', '.join(team_data['players'])}")
-        total_assigned += len(team_data["players"])
+        roster = team_data["players"]
+        budget_str = f"₹{team_data['budget']:.1f}Cr"
+        out(f"\n{team_name}:")
+        out(f"  Players: {len(roster)}")
+        out(f"  Budget left: {budget_str}")
+        out(f"  Squad: {', '.join(NAMES[p] for p in roster)}")
+        total_assigned += len(roster)
+        all_assigned.update(roster)
+        distribution.append(len(roster))
+        budgets.append(budget_str)
     
     # Check unsold players
-    all_assigned = [player for team in teams.values() for player in team["players"]]
-    unsold = [name for name in players.keys() if name not in all_assigned]
+    unsold = [i for i in range(len(NAMES)) if i not in all_assigned]
     
-    print(f"\n❌ UNSOLD PLAYERS ({len(unsold)}):")
-    for player in unsold:
-        print(f"  {player} (Rating: {players[player]})")
+    out(f"\n❌ UNSOLD PLAYERS ({len(unsold)}):")
+    for player_id in unsold:
+        out(f"  {NAMES[player_id]} (Rating: {RATINGS[player_id]})")
     
-    print(f"\nTotal assigned: {total_assigned}/26")
+    out(f"\nTotal assigned: {total_assigned}/26")
     if total_assigned == 26:
-        print("✅ Perfect! All players assigned through sequential auction.")
+        out("✅ Perfect! All players assigned through sequential auction.")
     else:
-        print(f"⚠️  {26 - total_assigned} players unassigned - this shouldn't happen in real auction!")
+        out(f"⚠️  {26 - total_assigned} players unassigned - this shouldn't happen in real auction!")
     
     if unsold:
-        print(f"\n=== REMAINING PLAYERS (Should be 0 in sequential auction) ===")
-        for player in unsold:
-            print(f"  {player} - This shouldn't happen in real sequential auction!")
-    
-    print(f"\n=== FINAL DISTRIBUTION ===")
-    distribution = [len(team['players']) for team in teams.values()]
-    budgets = [f'₹{team["budget"]:.1f}Cr' for team in teams.values()]
-    print(f"Team sizes: {distribution}")
-    print(f"Budgets left: {budgets}")
+        out(f"\n=== REMAINING PLAYERS (Should be 0 in sequential auction) ===")
+        for player_id in unsold:
+            out(f"  {NAMES[player_id]} - This shouldn't happen in real sequential auction!")
+    
+    out(f"\n=== FINAL DISTRIBUTION ===")
+    out(f"Team sizes: {distribution}")
+    out(f"Budgets left: {budgets}")
+    flush_log()
+    return teams
+
+def _trial_result(seed):
+    """Final (budgets, squad sizes) of one silent simulation run"""
+    result = simulate_sequential_auction(seed, verbose=False)
+    return [t["budget"] for t in result.values()], [t["size"] for t in result.values()]
+
+def run_trials(n_trials, seed=0, workers=None):
+    """Run n_trials independent simulations (seeds seed .. seed+n_trials-1) across
+    processes; returns (budgets, sizes) arrays of shape (n_trials, n_teams)"""
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_trial_result, range(seed, seed + n_trials),
+                                chunksize=max(1, n_trials // (4 * workers))))
+    budgets = np.array([b for b, _ in results], dtype=np.float64).reshape(n_trials, len(teams))
+    sizes = np.array([s for _, s in results], dtype=np.int16).reshape(n_trials, len(teams))
+    return budgets, sizes
 
 if __name__ == "__main__":
     simulate_sequential_auction()
\ No newline at end of file
@@ -5,6 +5,7 @@ Simulates multiple SSE connections and rapid bidding to test for lag issues
 """
 
 import requests
+import requests.adapters
 import threading
 import time
 import json
@@ -12,10 +13,20 @@ from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 BASE_URL = "http://localhost:5000"
+POOL_SIZE = 64  # Keep-alive connections per host for the admin session's bidder threads
+
+def make_session(pool_size):
+    """requests.Session with a keep-alive pool of pool_size connections and no retries"""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 def get_admin_session():
     """Login and get admin session cookie"""
-    session = requests.Session()
+    # Large keep-alive pool so concurrent bidders don't queue for a connection
+    session = make_session(POOL_SIZE)
     # Login to admin
     login_data = {"password": "admin123"}
     response = session.post(f"{BASE_URL}/admin", data=login_data)
@@ -28,17 +39,26 @@ def get_admin_session():
 def simulate_sse_connection(connection_id, duration=120):
     """Simulate SSE connection for specified duration"""
     print(f"SSE Connection {connection_id} starting...")
+    # Each viewer is anonymous and owns its session; sessions aren't shared across threads
+    session = make_session(1)
     try:
-        response = requests.get(f"{BASE_URL}/events", stream=True, timeout=duration)
+        response = session.get(f"{BASE_URL}/events", stream=True, timeout=duration)
         message_count = 0
-        for line in response.iter_lines():
-            if line:
-                message_count += 1
-                if message_count % 10 == 0:
+        tail = b""
+        # Count raw bytes instead of splitting lines; each SSE message ends with a blank line
+        for chunk in response.iter_content(chunk_size=None):
+            data = tail + chunk
+            received = data.count(b"\n\n")
+            tail = data[-1:]
+            if received:
+                before = message_count
+                message_count += received
+                if message_count // 10 > before // 10:
                     print(f"SSE {connection_id}: Received {message_count} messages")
     except Exception as e:
         print(f"SSE Connection {connection_id} error: {e}")
     finally:
+        session.close()
         print(f"SSE Connection {connection_id} ended")
 
 def make_bid(session, player_id, team, bid_num):
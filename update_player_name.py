@@ -12,27 +12,35 @@ def list_players():
     conn = sqlite3.connect(DB_FILE)
     cursor = conn.cursor()
     cursor.execute("SELECT player_id, name, role, team, status FROM players ORDER BY player_id")
-    players = cursor.fetchall()
-    conn.close()
     
-    print("\n=== Current Players ===")
-    print(f"{'ID':<5} {'Name':<30} {'Role':<15} {'Team':<15} {'Status':<10}")
-    print("-" * 80)
-    for player in players:
-        player_id, name, role, team, status = player
-        print(f"{player_id:<5} {name:<30} {role or '-':<15} {team or '-':<15} {status or '-':<10}")
-    print()
+    lines = [
+        "\n=== Current Players ===",
+        f"{'ID':<5} {'Name':<30} {'Role':<15} {'Team':<15} {'Status':<10}",
+        "-" * 80,
+    ]
+    # Format rows straight off the cursor and write the table in one go
+    for player_id, name, role, team, status in cursor:
+        lines.append(f"{player_id:<5} {name:<30} {role or '-':<15} {team or '-':<15} {status or '-':<10}")
+    conn.close()
+    lines.append("\n")
+    sys.stdout.write("\n".join(lines))
 
 def update_player_name(player_id, new_name):
     """Update a player's name"""
-    conn = sqlite3.connect(DB_FILE)
+    conn = sqlite3.connect(DB_FILE, isolation_level=None)
     cursor = conn.cursor()
+    # Same player_id index the app creates, so both statements below are index probes
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_players_player_id ON players(player_id)")
+    
+    # Read the old name and write the new one in a single write transaction
+    cursor.execute("BEGIN IMMEDIATE")
     
     # Check if player exists
     cursor.execute("SELECT name FROM players WHERE player_id = ?", (player_id,))
     result = cursor.fetchone()
     
     if not result:
+        cursor.execute("ROLLBACK")
         print(f"Error: Player with ID {player_id} not found!")
         conn.close()
         return False
@@ -41,7 +49,7 @@ def update_player_name(player_id, new_name):
     
     # Update the name
     cursor.execute("UPDATE players SET name = ? WHERE player_id = ?", (new_name, player_id))
-    conn.commit()
+    cursor.execute("COMMIT")
     conn.close()
     
     print(f"\n✓ Successfully updated player #{player_id}")